@@ -29,34 +29,135 @@ Examples:
 
 import re
 import os
+import mmap
 import sys
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Set, List, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, Set, List, Optional, Tuple, Iterator
+from types import MappingProxyType
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
-def parse_strings_file(file_path: Path) -> Dict[str, str]:
-    """Parse a .strings file and return a dictionary of key-value pairs."""
-    strings = {}
+# Regexes used by find_accessibility_label_keys_in_code, compiled once at import
+# so every Swift file scan reuses the same compiled pattern. They are bytes
+# patterns because Swift files are scanned through an mmap.
+
+# Single-pass scanner; each Swift file is walked once and matches are
+# dispatched on the named group that fired. Both alternatives only capture
+# keys containing an ".accessibility." segment, so matches need no filtering.
+#
+# label: accessibilityLabel: "key" or accessibilityLabel: key
+#   Matches: accessibilityLabel: "MyApp.accessibility.button.save"
+#            accessibilityLabel: Strings.accessibility.save
+#   This also covers .automaticCompliance(accessibilityLabel: "key"), whose
+#   accessibilityLabel argument is matched by the same alternative.
+#
+# literal: Direct string literals that look like localization keys
+#   Matches: "SixLayerFramework.accessibility.button.save"
+#            "MyApp.accessibility.field.email"
+_ACCESSIBILITY_KEY_RE = re.compile(
+    rb'(?P<label>accessibilityLabel\s*:\s*["\']?(?P<label_key>[A-Za-z][A-Za-z0-9_.]*\.accessibility\.[A-Za-z0-9_.]+)["\']?)'
+    rb'|(?P<literal>["\'](?P<literal_key>[A-Za-z][A-Za-z0-9_]+\.accessibility\.[A-Za-z0-9_.]+)["\'])'
+)
+
+# .strings entries: "key" = "value";
+# Each step of the value group is either a plain character or a complete
+# backslash escape, so it cannot backtrack catastrophically.
+_STRINGS_RE = re.compile(rb'"([^"]+)"\s*=\s*"((?:[^"\\]|\\.)*)"\s*;')
+
+# Common language code to name mapping
+_LANG_NAMES = MappingProxyType({
+    'en': 'English',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'zh-Hans': 'Simplified Chinese',
+    'zh-Hant': 'Traditional Chinese',
+    'pl': 'Polish',
+    'pt': 'Portuguese',
+    'it': 'Italian',
+    'ru': 'Russian',
+    'ar': 'Arabic',
+    'hi': 'Hindi',
+    'de-CH': 'Swiss German',
+    'fr-CA': 'Canadian French',
+    'es-MX': 'Mexican Spanish',
+})
+
+def parse_strings_keys_only(file_path: Path) -> Set[str]:
+    """Parse a .strings file and return only its keys, skipping value decoding."""
+    keys = set()
     if not file_path.exists():
-        return strings
+        return keys
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with open(file_path, 'rb') as f:
+        # mmap rejects zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return keys
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for match in _STRINGS_RE.finditer(content):
+                keys.add(sys.intern(match.group(1).decode('utf-8')))
     
-    # Match lines like: "key" = "value";
-    pattern = r'"([^"]+)"\s*=\s*"([^"]*(?:\\.[^"]*)*)"\s*;'
-    matches = re.finditer(pattern, content, re.MULTILINE)
-    
-    for match in matches:
-        key = match.group(1)
-        value = match.group(2)
-        # Unescape the value
-        value = value.replace('\\"', '"').replace('\\n', '\n').replace('\\\\', '\\')
-        strings[key] = value
-    
-    return strings
+    return keys
+
+def _iter_swift_files(root: str) -> Iterator[str]:
+    """Yield paths of all .swift files under root, without following symlinks."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.swift') and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+def _scan_one_file(swift_file: str) -> Set[str]:
+    """Return the accessibility label keys found in a single Swift file."""
+    found_keys = set()
+    try:
+        with open(swift_file, 'rb') as f:
+            # mmap rejects zero-length files
+            if os.fstat(f.fileno()).st_size == 0:
+                return found_keys
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                # Each file is read once front to back; ask for readahead
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    content.madvise(mmap.MADV_SEQUENTIAL)
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    content.madvise(mmap.MADV_WILLNEED)
+
+                # Every match contains one of these literals; most files have
+                # neither, so skip them before running any regex
+                hits = [
+                    offset for offset in (
+                        content.find(b'accessibilityLabel'),
+                        content.find(b'.accessibility.'),
+                    )
+                    if offset != -1
+                ]
+                if not hits:
+                    return found_keys
+
+                # Keys never span lines, so no match can start before the line
+                # holding the first literal hit; begin the regex scan there
+                start = content.rfind(b'\n', 0, min(hits)) + 1
+
+                for match in _ACCESSIBILITY_KEY_RE.finditer(content, start):
+                    key = match.group('label_key' if match.lastgroup == 'label' else 'literal_key')
+                    found_keys.add(key.decode('utf-8'))
+
+    except Exception:
+        # Skip files that can't be read
+        pass
+
+    return found_keys
 
 def find_accessibility_label_keys_in_code(codebase_dir: Path) -> Set[str]:
     """
@@ -67,6 +168,8 @@ def find_accessibility_label_keys_in_code(codebase_dir: Path) -> Set[str]:
     2. DynamicFormField.label usage (which becomes accessibility labels)
     3. Explicit localization keys passed as accessibilityLabel
     
+    Files are independent, so they are scanned in parallel worker processes.
+    
     Returns set of found localization keys.
     """
     found_keys = set()
@@ -74,66 +177,36 @@ def find_accessibility_label_keys_in_code(codebase_dir: Path) -> Set[str]:
     if not codebase_dir.exists():
         return found_keys
     
-    # Pattern 1: accessibilityLabel: "key" or accessibilityLabel: key
-    # Matches: accessibilityLabel: "MyApp.accessibility.button.save"
-    #          accessibilityLabel: field.label (where field.label might be a key)
-    accessibility_label_pattern = re.compile(
-        r'accessibilityLabel\s*:\s*["\']?([A-Za-z][A-Za-z0-9_.]+)["\']?',
-        re.MULTILINE
-    )
+    # Scan all Swift files
+    swift_files = list(_iter_swift_files(str(codebase_dir)))
+    if not swift_files:
+        return found_keys
     
-    # Pattern 2: .automaticCompliance(accessibilityLabel: "key")
-    automatic_compliance_pattern = re.compile(
-        r'\.automaticCompliance\s*\([^)]*accessibilityLabel\s*:\s*["\']?([A-Za-z][A-Za-z0-9_.]+)["\']?',
-        re.MULTILINE | re.DOTALL
-    )
+    with ProcessPoolExecutor() as executor:
+        for partial in executor.map(_scan_one_file, swift_files, chunksize=32):
+            # Keys come back from worker processes as fresh copies; intern
+            # them so keys shared with the .strings files are one object
+            found_keys.update(map(sys.intern, partial))
     
-    # Pattern 3: field.label where field is DynamicFormField
-    # This is harder to detect statically, but we can look for patterns like:
-    # accessibilityLabel: field.label
-    field_label_pattern = re.compile(
-        r'accessibilityLabel\s*:\s*(\w+)\.label',
-        re.MULTILINE
-    )
+    return found_keys
+
+@lru_cache(maxsize=None)
+def _discover_language_directories(base_dir: str, base_lang_code: str) -> Tuple[Tuple[str, str], ...]:
+    """Cached worker for discover_language_directories, keyed by the stringified base_dir."""
+    languages = []
+    base_path = Path(base_dir)
     
-    # Pattern 4: Direct string literals that look like localization keys
-    # Matches: "SixLayerFramework.accessibility.button.save"
-    #          "MyApp.accessibility.field.email"
-    localization_key_pattern = re.compile(
-        r'["\']([A-Za-z][A-Za-z0-9_]+\.accessibility\.[A-Za-z0-9_.]+)["\']',
-        re.MULTILINE
-    )
+    if not base_path.exists():
+        return ()
     
-    # Scan all Swift files
-    for swift_file in codebase_dir.rglob('*.swift'):
-        try:
-            with open(swift_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find accessibilityLabel parameters
-            for match in accessibility_label_pattern.finditer(content):
-                key = match.group(1)
-                # Check if it looks like a localization key (contains dots and "accessibility")
-                if '.' in key and 'accessibility' in key.lower():
-                    found_keys.add(key)
-            
-            # Find automaticCompliance calls with accessibilityLabel
-            for match in automatic_compliance_pattern.finditer(content):
-                key = match.group(1)
-                if '.' in key and 'accessibility' in key.lower():
-                    found_keys.add(key)
-            
-            # Find direct localization keys
-            for match in localization_key_pattern.finditer(content):
-                key = match.group(1)
-                if 'accessibility' in key.lower():
-                    found_keys.add(key)
-        
-        except Exception as e:
-            # Skip files that can't be read
-            continue
+    for item in base_path.iterdir():
+        if item.is_dir() and item.name.endswith('.lproj'):
+            lang_code = item.name.replace('.lproj', '')
+            # Skip the base language directory
+            if lang_code != base_lang_code:
+                languages.append((lang_code, get_language_name(lang_code)))
     
-    return found_keys
+    return tuple(languages)
 
 def discover_language_directories(base_dir: Path, base_lang_code: str = 'en') -> Dict[str, str]:
     """
@@ -142,41 +215,8 @@ def discover_language_directories(base_dir: Path, base_lang_code: str = 'en') ->
     Looks for directories matching pattern: {lang_code}.lproj
     Returns a dict mapping lang_code to display name.
     """
-    languages = {}
-    
-    if not base_dir.exists():
-        return languages
-    
-    # Common language code to name mapping
-    lang_names = {
-        'en': 'English',
-        'es': 'Spanish',
-        'fr': 'French',
-        'de': 'German',
-        'ja': 'Japanese',
-        'ko': 'Korean',
-        'zh-Hans': 'Simplified Chinese',
-        'zh-Hant': 'Traditional Chinese',
-        'pl': 'Polish',
-        'pt': 'Portuguese',
-        'it': 'Italian',
-        'ru': 'Russian',
-        'ar': 'Arabic',
-        'hi': 'Hindi',
-        'de-CH': 'Swiss German',
-        'fr-CA': 'Canadian French',
-        'es-MX': 'Mexican Spanish',
-    }
-    
-    for item in base_dir.iterdir():
-        if item.is_dir() and item.name.endswith('.lproj'):
-            lang_code = item.name.replace('.lproj', '')
-            # Skip the base language directory
-            if lang_code != base_lang_code:
-                display_name = lang_names.get(lang_code, lang_code)
-                languages[lang_code] = display_name
-    
-    return languages
+    # The cache holds an immutable tuple; each caller gets its own dict
+    return dict(_discover_language_directories(str(base_dir), base_lang_code))
 
 def find_base_language_file(base_dir: Path, base_lang_code: str = 'en', filename: str = 'Localizable.strings') -> Optional[Path]:
     """Find the base language file."""
@@ -193,72 +233,63 @@ def find_base_language_file(base_dir: Path, base_lang_code: str = 'en', filename
     
     return None
 
-def find_language_file(base_dir: Path, lang_code: str, filename: str = 'Localizable.strings') -> Optional[Path]:
-    """Find a language file."""
-    lang_dir = base_dir / f'{lang_code}.lproj'
-    lang_file = lang_dir / filename
-    
-    if lang_file.exists():
-        return lang_file
-    
-    return None
+def _enumerate_lang_files(base_dir: Path, filename: str = 'Localizable.strings') -> Iterator[Tuple[str, Path]]:
+    """Yield (lang_code, path) for every {lang_code}.lproj/filename under base_dir."""
+    try:
+        with os.scandir(base_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.lproj') and entry.is_dir():
+                    lang_file = Path(entry.path) / filename
+                    if lang_file.exists():
+                        yield entry.name[:-len('.lproj')], lang_file
+    except OSError:
+        return
 
+@lru_cache(maxsize=None)
 def get_language_name(lang_code: str) -> str:
     """Get display name for a language code."""
-    lang_names = {
-        'en': 'English',
-        'es': 'Spanish',
-        'fr': 'French',
-        'de': 'German',
-        'ja': 'Japanese',
-        'ko': 'Korean',
-        'zh-Hans': 'Simplified Chinese',
-        'zh-Hant': 'Traditional Chinese',
-        'pl': 'Polish',
-        'pt': 'Portuguese',
-        'it': 'Italian',
-        'ru': 'Russian',
-        'ar': 'Arabic',
-        'hi': 'Hindi',
-        'de-CH': 'Swiss German',
-        'fr-CA': 'Canadian French',
-        'es-MX': 'Mexican Spanish',
-    }
-    return lang_names.get(lang_code, lang_code)
+    return _LANG_NAMES.get(lang_code, lang_code)
 
 def write_report(
     report_file: Path,
     found_keys: Set[str],
-    missing_by_lang: Dict[str, Set[str]],
+    sorted_missing: List[Tuple[str, List[str]]],
     base_lang_code: str = 'en'
 ) -> None:
-    """Write the missing keys report to a file."""
+    """
+    Write the missing keys report to a file.
+    
+    sorted_missing holds (lang_code, missing keys) pairs already sorted by
+    language code and key, as built by main.
+    """
     all_missing = set()
-    for missing in missing_by_lang.values():
+    for _, missing in sorted_missing:
         all_missing.update(missing)
     
+    # Build the report in memory and write it with a single call
+    parts = [
+        "Missing Accessibility Label Localization Keys Report\n",
+        "=" * 70 + "\n\n",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"Base language: {get_language_name(base_lang_code)} ({base_lang_code})\n",
+        f"Total accessibility label keys found in codebase: {len(found_keys)}\n",
+        f"Total missing keys across all languages: {len(all_missing)}\n\n",
+    ]
+    
+    if found_keys:
+        parts.append("Accessibility Label Keys Found in Codebase:\n")
+        parts.append("-" * 70 + "\n")
+        parts.extend(f'  "{key}"\n' for key in sorted(found_keys))
+        parts.append("\n")
+    
+    for lang_code, missing in sorted_missing:
+        if missing:
+            parts.append(f"\n{get_language_name(lang_code)} ({lang_code}): {len(missing)} missing\n")
+            parts.append("-" * 70 + "\n")
+            parts.extend(f'\nKey: "{key}"\nTranslation needed\n' for key in missing)
+    
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("Missing Accessibility Label Localization Keys Report\n")
-        f.write("=" * 70 + "\n\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Base language: {get_language_name(base_lang_code)} ({base_lang_code})\n")
-        f.write(f"Total accessibility label keys found in codebase: {len(found_keys)}\n")
-        f.write(f"Total missing keys across all languages: {len(all_missing)}\n\n")
-        
-        if found_keys:
-            f.write("Accessibility Label Keys Found in Codebase:\n")
-            f.write("-" * 70 + "\n")
-            for key in sorted(found_keys):
-                f.write(f'  "{key}"\n')
-            f.write("\n")
-        
-        for lang_code, missing in sorted(missing_by_lang.items()):
-            if missing:
-                f.write(f"\n{get_language_name(lang_code)} ({lang_code}): {len(missing)} missing\n")
-                f.write("-" * 70 + "\n")
-                for key in sorted(missing):
-                    f.write(f'\nKey: "{key}"\n')
-                    f.write(f'Translation needed\n')
+        f.write(''.join(parts))
 
 def main() -> int:
     """Main function to check accessibility label localization completeness."""
@@ -380,13 +411,13 @@ Examples:
         # Continue anyway - we can still check against found keys
     
     # Parse base language file if it exists
-    base_strings = {}
+    base_keys = set()
     if base_file and base_file.exists():
         if not args.quiet:
             print(f"\nParsing base language file: {base_file}")
-        base_strings = parse_strings_file(base_file)
+        base_keys = parse_strings_keys_only(base_file)
         if not args.quiet:
-            print(f"Found {len(base_strings)} key(s) in base language file")
+            print(f"Found {len(base_keys)} key(s) in base language file")
     
     # Determine which languages to check
     if args.languages:
@@ -402,44 +433,48 @@ Examples:
     if not args.quiet:
         print(f"\nChecking {len(languages_to_check)} language(s)...")
     
-    # Check each language
-    missing_by_lang = {}
+    # Check each language; languages are visited in sorted order and each
+    # missing set is sorted once, so the results are reused as-is below
+    sorted_missing = []
     all_missing = set()
     
     # Keys to check: either from codebase scan or from base strings file
     keys_to_check = found_keys
-    if base_strings:
+    if base_keys:
         # Also include keys from base strings file that match accessibility pattern
-        for key in base_strings.keys():
+        for key in base_keys:
             if 'accessibility' in key.lower():
                 keys_to_check.add(key)
     
+    # Locate every language file with a single directory listing
+    lang_files = dict(_enumerate_lang_files(base_dir, args.filename))
+    
+    # Load every language's keys first, then find missing accessibility
+    # label keys for all languages in one batch of set differences
+    lang_keys_map = {
+        lang_code: parse_strings_keys_only(lang_files[lang_code])
+        for lang_code in languages_to_check
+        if lang_code in lang_files
+    }
+    missing_by_lang = {lang_code: keys_to_check - keys for lang_code, keys in lang_keys_map.items()}
+    
     for lang_code, lang_name in sorted(languages_to_check.items()):
-        lang_file = find_language_file(base_dir, lang_code, args.filename)
-        
-        if not lang_file:
+        if lang_code not in missing_by_lang:
             if not args.quiet:
                 print(f"\n{lang_name} ({lang_code}): ⚠ File not found")
-            missing_by_lang[lang_code] = keys_to_check.copy()  # All keys missing
+            sorted_missing.append((lang_code, sorted(keys_to_check)))  # All keys missing
             all_missing.update(keys_to_check)
             continue
         
-        lang_strings = parse_strings_file(lang_file)
-        lang_keys = set(lang_strings.keys())
-        
-        # Find missing accessibility label keys
-        missing = set()
-        for key in keys_to_check:
-            if key not in lang_keys:
-                missing.add(key)
+        missing = sorted(missing_by_lang[lang_code])
         
-        missing_by_lang[lang_code] = missing
+        sorted_missing.append((lang_code, missing))
         all_missing.update(missing)
         
         if not args.quiet:
             if missing:
                 print(f"\n{lang_name} ({lang_code}): {len(missing)} missing accessibility label key(s)")
-                for key in sorted(missing):
+                for key in missing:
                     print(f"  - {key}")
             else:
                 print(f"\n{lang_name} ({lang_code}): ✓ Complete")
@@ -451,7 +486,7 @@ Examples:
         print(f"  Accessibility label keys found in codebase: {len(found_keys)}")
         print(f"  Total missing keys across all languages: {len(all_missing)}")
         
-        for lang_code, missing in sorted(missing_by_lang.items()):
+        for lang_code, missing in sorted_missing:
             if missing:
                 print(f"  {get_language_name(lang_code)}: {len(missing)} missing")
     
@@ -462,7 +497,7 @@ Examples:
         else:
             report_file = base_dir.parent / 'accessibility_labels_missing_keys_report.txt'
         
-        write_report(report_file, found_keys, missing_by_lang, base_lang_code)
+        write_report(report_file, found_keys, sorted_missing, base_lang_code)
         
         if not args.quiet:
             print(f"\nReport written to: {report_file}")
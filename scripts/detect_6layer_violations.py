@@ -30,134 +30,129 @@ import re
 import sys
 import os
 import json
+import hashlib
+import time
+import mmap
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Union
+from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+from contextlib import ExitStack
+from bisect import bisect_right
 import argparse
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ============================================================================
 # PRIORITY 1: Platform-Specific Types (Pure Swift types that differ)
 # ============================================================================
 
+def _platform_pair(suffix: str, replacement: str, hint: str, exclude_patterns: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """
+    Rules for a type that exists as both NS<suffix> (AppKit) and UI<suffix> (UIKit).
+
+    {name} in hint is replaced by the full type name, {prefix} in exclude
+    patterns by 'ns' or 'ui'.
+    """
+    rules = {}
+    for prefix in ('NS', 'UI'):
+        name = prefix + suffix
+        rule = {
+            'replacement': replacement,
+            'hint': hint.format(name=name),
+            'priority': 1,
+            'pattern': rf'\b{name}\b'
+        }
+        if exclude_patterns:
+            rule['exclude_patterns'] = [p.format(prefix=prefix.lower()) for p in exclude_patterns]
+        rules[name] = rule
+    return rules
+
 PLATFORM_TYPE_VIOLATIONS = {
     # ============================================================================
     # Color Types
     # ============================================================================
-    'NSColor': {
-        'replacement': 'Color.platform*',
-        'hint': 'Use Color.platformBackground, Color.platformLabel, etc. instead of NSColor',
-        'priority': 1,
-        'pattern': r'\bNSColor\b'
-    },
-    'UIColor': {
-        'replacement': 'Color.platform*',
-        'hint': 'Use Color.platformBackground, Color.platformLabel, etc. instead of UIColor',
-        'priority': 1,
-        'pattern': r'\bUIColor\b'
-    },
+    **_platform_pair(
+        'Color',
+        replacement='Color.platform*',
+        hint='Use Color.platformBackground, Color.platformLabel, etc. instead of {name}'
+    ),
     
     # ============================================================================
     # Font Types
     # ============================================================================
-    'NSFont': {
-        'replacement': 'Font.platform* or Font.system()',
-        'hint': 'Use Font.system() or platform-specific font extensions instead of NSFont',
-        'priority': 1,
-        'pattern': r'\bNSFont\b'
-    },
-    'UIFont': {
-        'replacement': 'Font.platform* or Font.system()',
-        'hint': 'Use Font.system() or platform-specific font extensions instead of UIFont',
-        'priority': 1,
-        'pattern': r'\bUIFont\b'
-    },
+    **_platform_pair(
+        'Font',
+        replacement='Font.platform* or Font.system()',
+        hint='Use Font.system() or platform-specific font extensions instead of {name}'
+    ),
     
     # ============================================================================
     # Image Types
     # ============================================================================
-    'NSImage': {
-        'replacement': 'PlatformImage',
-        'hint': 'Use PlatformImage instead of NSImage for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bNSImage\b',
-        'exclude_patterns': [
-            r'PlatformImage\s*\(\s*nsImage\s*:',  # PlatformImage(nsImage: ...)
-        ]
-    },
-    'UIImage': {
-        'replacement': 'PlatformImage',
-        'hint': 'Use PlatformImage instead of UIImage for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bUIImage\b',
-        'exclude_patterns': [
-            r'PlatformImage\s*\(\s*uiImage\s*:',  # PlatformImage(uiImage: ...)
+    **_platform_pair(
+        'Image',
+        replacement='PlatformImage',
+        hint='Use PlatformImage instead of {name} for cross-platform compatibility',
+        exclude_patterns=[
+            r'PlatformImage\s*\(\s*{prefix}Image\s*:',  # PlatformImage(nsImage: ...) / PlatformImage(uiImage: ...)
         ]
-    },
+    ),
     
     # ============================================================================
     # Clipboard Types
     # ============================================================================
-    'NSPasteboard': {
-        'replacement': 'PlatformClipboard',
-        'hint': 'Use PlatformClipboard.copyToClipboard() instead of NSPasteboard',
-        'priority': 1,
-        'pattern': r'\bNSPasteboard\b'
-    },
-    'UIPasteboard': {
-        'replacement': 'PlatformClipboard',
-        'hint': 'Use PlatformClipboard.copyToClipboard() instead of UIPasteboard',
-        'priority': 1,
-        'pattern': r'\bUIPasteboard\b'
-    },
+    **_platform_pair(
+        'Pasteboard',
+        replacement='PlatformClipboard',
+        hint='Use PlatformClipboard.copyToClipboard() instead of {name}'
+    ),
     
     # ============================================================================
     # View Controller Types
     # ============================================================================
-    'NSViewController': {
-        'replacement': 'Use SwiftUI View instead',
-        'hint': 'Use SwiftUI View types instead of NSViewController. Consider platformNavigation() or platformSheet() for presentation',
-        'priority': 1,
-        'pattern': r'\bNSViewController\b'
-    },
-    'UIViewController': {
-        'replacement': 'Use SwiftUI View instead',
-        'hint': 'Use SwiftUI View types instead of UIViewController. Consider platformNavigation() or platformSheet() for presentation',
-        'priority': 1,
-        'pattern': r'\bUIViewController\b'
-    },
+    **_platform_pair(
+        'ViewController',
+        replacement='Use SwiftUI View instead',
+        hint='Use SwiftUI View types instead of {name}. Consider platformNavigation() or platformSheet() for presentation'
+    ),
     
     # ============================================================================
     # View Types
     # ============================================================================
-    'NSView': {
-        'replacement': 'Use SwiftUI View instead',
-        'hint': 'Use SwiftUI View types instead of NSView. Use platform-specific view extensions if needed',
-        'priority': 1,
-        'pattern': r'\bNSView\b'
-    },
-    'UIView': {
-        'replacement': 'Use SwiftUI View instead',
-        'hint': 'Use SwiftUI View types instead of UIView. Use platform-specific view extensions if needed',
-        'priority': 1,
-        'pattern': r'\bUIView\b'
-    },
+    **_platform_pair(
+        'View',
+        replacement='Use SwiftUI View instead',
+        hint='Use SwiftUI View types instead of {name}. Use platform-specific view extensions if needed'
+    ),
     
     # ============================================================================
     # Window Types
     # ============================================================================
-    'NSWindow': {
-        'replacement': 'Use WindowGroup in @main App struct, or platformSheet_L4() for modal windows',
-        'hint': 'Use SwiftUI WindowGroup in your @main App struct instead of NSWindow. For modal windows, use platformSheet_L4(). For document-based apps, use DocumentGroup. For window state detection, use UnifiedWindowDetection.',
-        'priority': 1,
-        'pattern': r'\bNSWindow\b'
-    },
-    'UIWindow': {
-        'replacement': 'Use WindowGroup in @main App struct, or platformSheet_L4() for modal windows',
-        'hint': 'Use SwiftUI WindowGroup in your @main App struct instead of UIWindow. For modal windows, use platformSheet_L4(). For document-based apps, use DocumentGroup. For window state detection, use UnifiedWindowDetection.',
-        'priority': 1,
-        'pattern': r'\bUIWindow\b'
-    },
+    **_platform_pair(
+        'Window',
+        replacement='Use WindowGroup in @main App struct, or platformSheet_L4() for modal windows',
+        hint='Use SwiftUI WindowGroup in your @main App struct instead of {name}. For modal windows, use platformSheet_L4(). For document-based apps, use DocumentGroup. For window state detection, use UnifiedWindowDetection.'
+    ),
     
     # ============================================================================
     # Alert Types
@@ -178,46 +173,25 @@ PLATFORM_TYPE_VIOLATIONS = {
     # ============================================================================
     # Navigation Types
     # ============================================================================
-    'NSNavigationController': {
-        'replacement': 'platformNavigation() or platformNavigationStack()',
-        'hint': 'Use platformNavigation() or platformNavigationStack() instead of NSNavigationController',
-        'priority': 1,
-        'pattern': r'\bNSNavigationController\b'
-    },
-    'UINavigationController': {
-        'replacement': 'platformNavigation() or platformNavigationStack()',
-        'hint': 'Use platformNavigation() or platformNavigationStack() instead of UINavigationController',
-        'priority': 1,
-        'pattern': r'\bUINavigationController\b'
-    },
+    **_platform_pair(
+        'NavigationController',
+        replacement='platformNavigation() or platformNavigationStack()',
+        hint='Use platformNavigation() or platformNavigationStack() instead of {name}'
+    ),
     
     # ============================================================================
     # Table/Collection View Types
     # ============================================================================
-    'NSTableView': {
-        'replacement': 'platformPresentItemCollection_L1() or List',
-        'hint': 'Use platformPresentItemCollection_L1() or SwiftUI List instead of NSTableView',
-        'priority': 1,
-        'pattern': r'\bNSTableView\b'
-    },
-    'UITableView': {
-        'replacement': 'platformPresentItemCollection_L1() or List',
-        'hint': 'Use platformPresentItemCollection_L1() or SwiftUI List instead of UITableView',
-        'priority': 1,
-        'pattern': r'\bUITableView\b'
-    },
-    'NSCollectionView': {
-        'replacement': 'platformPresentItemCollection_L1() or LazyVGrid/LazyHGrid',
-        'hint': 'Use platformPresentItemCollection_L1() or SwiftUI LazyVGrid/LazyHGrid instead of NSCollectionView',
-        'priority': 1,
-        'pattern': r'\bNSCollectionView\b'
-    },
-    'UICollectionView': {
-        'replacement': 'platformPresentItemCollection_L1() or LazyVGrid/LazyHGrid',
-        'hint': 'Use platformPresentItemCollection_L1() or SwiftUI LazyVGrid/LazyHGrid instead of UICollectionView',
-        'priority': 1,
-        'pattern': r'\bUICollectionView\b'
-    },
+    **_platform_pair(
+        'TableView',
+        replacement='platformPresentItemCollection_L1() or List',
+        hint='Use platformPresentItemCollection_L1() or SwiftUI List instead of {name}'
+    ),
+    **_platform_pair(
+        'CollectionView',
+        replacement='platformPresentItemCollection_L1() or LazyVGrid/LazyHGrid',
+        hint='Use platformPresentItemCollection_L1() or SwiftUI LazyVGrid/LazyHGrid instead of {name}'
+    ),
     
     # ============================================================================
     # Sharing Types
@@ -238,18 +212,11 @@ PLATFORM_TYPE_VIOLATIONS = {
     # ============================================================================
     # Screen/Device Types
     # ============================================================================
-    'NSScreen': {
-        'replacement': 'Use platform-specific screen detection extensions',
-        'hint': 'Use platform-specific screen detection extensions instead of NSScreen directly',
-        'priority': 1,
-        'pattern': r'\bNSScreen\b'
-    },
-    'UIScreen': {
-        'replacement': 'Use platform-specific screen detection extensions',
-        'hint': 'Use platform-specific screen detection extensions instead of UIScreen directly',
-        'priority': 1,
-        'pattern': r'\bUIScreen\b'
-    },
+    **_platform_pair(
+        'Screen',
+        replacement='Use platform-specific screen detection extensions',
+        hint='Use platform-specific screen detection extensions instead of {name} directly'
+    ),
     'UIDevice': {
         'replacement': 'SixLayerPlatform.deviceType or RuntimeCapabilityDetection',
         'hint': 'Use SixLayerPlatform.deviceType or RuntimeCapabilityDetection instead of UIDevice',
@@ -260,18 +227,11 @@ PLATFORM_TYPE_VIOLATIONS = {
     # ============================================================================
     # Application Types
     # ============================================================================
-    'NSApplication': {
-        'replacement': 'Use SwiftUI App lifecycle',
-        'hint': 'Use SwiftUI @main App lifecycle instead of NSApplication',
-        'priority': 1,
-        'pattern': r'\bNSApplication\b'
-    },
-    'UIApplication': {
-        'replacement': 'Use SwiftUI App lifecycle',
-        'hint': 'Use SwiftUI @main App lifecycle instead of UIApplication',
-        'priority': 1,
-        'pattern': r'\bUIApplication\b'
-    },
+    **_platform_pair(
+        'Application',
+        replacement='Use SwiftUI App lifecycle',
+        hint='Use SwiftUI @main App lifecycle instead of {name}'
+    ),
     
     # ============================================================================
     # Graphics Context Types
@@ -308,50 +268,29 @@ PLATFORM_TYPE_VIOLATIONS = {
     # ============================================================================
     # Size Types
     # ============================================================================
-    'NSSize': {
-        'replacement': 'CGSize',
-        'hint': 'Use CGSize instead of NSSize for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bNSSize\b'
-    },
-    'UISize': {
-        'replacement': 'CGSize',
-        'hint': 'Use CGSize instead of UISize for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bUISize\b'
-    },
+    **_platform_pair(
+        'Size',
+        replacement='CGSize',
+        hint='Use CGSize instead of {name} for cross-platform compatibility'
+    ),
     
     # ============================================================================
     # Point Types
     # ============================================================================
-    'NSPoint': {
-        'replacement': 'CGPoint',
-        'hint': 'Use CGPoint instead of NSPoint for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bNSPoint\b'
-    },
-    'UIPoint': {
-        'replacement': 'CGPoint',
-        'hint': 'Use CGPoint instead of UIPoint for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bUIPoint\b'
-    },
+    **_platform_pair(
+        'Point',
+        replacement='CGPoint',
+        hint='Use CGPoint instead of {name} for cross-platform compatibility'
+    ),
     
     # ============================================================================
     # Rect Types
     # ============================================================================
-    'NSRect': {
-        'replacement': 'CGRect',
-        'hint': 'Use CGRect instead of NSRect for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bNSRect\b'
-    },
-    'UIRect': {
-        'replacement': 'CGRect',
-        'hint': 'Use CGRect instead of UIRect for cross-platform compatibility',
-        'priority': 1,
-        'pattern': r'\bUIRect\b'
-    },
+    **_platform_pair(
+        'Rect',
+        replacement='CGRect',
+        hint='Use CGRect instead of {name} for cross-platform compatibility'
+    ),
 }
 
 # ============================================================================
@@ -443,11 +382,208 @@ VIEW_VIOLATIONS = {
     },
 }
 
+# ============================================================================
+# Compiled Patterns
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """A violation rule with its patterns compiled once, at import time."""
+    name: str
+    replacement: str
+    hint: str
+    priority: int
+    pattern: re.Pattern
+    exclude_patterns: Tuple[re.Pattern, ...] = ()
+    exclude_in_framework: bool = False
+    # Set only for rules that require context; searched around each match
+    context_pattern: Optional[re.Pattern] = None
+
+# Exclude patterns recur across rules (e.g. platformPresentItemCollection_L1\s*\(
+# on both VStack and HStack); each distinct pattern is compiled once and shared.
+_EXCL_CACHE: Dict[str, re.Pattern] = {}
+
+def _excl(pattern: str) -> re.Pattern:
+    compiled = _EXCL_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _EXCL_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
+def _build_rules(violations: Dict[str, Dict]) -> Dict[str, Rule]:
+    """
+    Build the Rule objects for a violation table, keyed by rule name.
+
+    Runs at import, so a malformed rule fails immediately with its name
+    rather than on the first file that happens to reach it.
+    """
+    rules = {}
+    for name, violation_info in violations.items():
+        exclude_patterns = violation_info.get('exclude_patterns', [])
+        # A bare string would silently be compiled character by character
+        if isinstance(exclude_patterns, str):
+            raise ValueError(f"Rule {name!r}: exclude_patterns must be a list of patterns, not a string")
+        context_pattern = violation_info.get('context_pattern')
+        try:
+            rules[name] = Rule(
+                name=name,
+                replacement=violation_info['replacement'],
+                hint=violation_info['hint'],
+                priority=violation_info['priority'],
+                pattern=re.compile(violation_info['pattern']),
+                exclude_patterns=tuple(_excl(p) for p in exclude_patterns),
+                exclude_in_framework=violation_info.get('exclude_in_framework', False),
+                context_pattern=(
+                    re.compile(context_pattern)
+                    if violation_info.get('requires_context', False) and context_pattern else None
+                )
+            )
+        except (KeyError, re.error) as e:
+            raise ValueError(f"Rule {name!r}: invalid definition ({e!r})") from e
+    return rules
+
+_PLATFORM_TYPE_RULES = _build_rules(PLATFORM_TYPE_VIOLATIONS)
+_VIEW_RULES = _build_rules(VIEW_VIOLATIONS)
+
+def _trie_pattern(words) -> str:
+    """
+    Regex alternation of literal words, factored by common prefix.
+
+    NSView|NSViewController|NSWindow becomes NS(?:View(?:Controller)?|Window),
+    so the engine tests each shared prefix once instead of once per word.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A word ending here makes the rest optional
+        return '(?:' + body + ')?' if '' in node else body
+
+    return emit(trie)
+
+# Every PRIORITY 1 rule is a word-bounded identifier, so a single alternation
+# finds the same matches in one scan per line; the matched identifier is the
+# rule name.
+_PLATFORM_TYPE_RE = re.compile(r'\b(' + _trie_pattern(PLATFORM_TYPE_VIOLATIONS) + r')\b')
+
+# PRIORITY 2 patterns have different suffixes, so each alternative gets its
+# own named group; _VIEW_GROUP_NAMES maps the group back to the rule name.
+_VIEW_GROUP_NAMES = {f'view{i}': name for i, name in enumerate(VIEW_VIOLATIONS)}
+
+def _build_view_re(in_framework: bool) -> Optional[re.Pattern]:
+    """Alternation of the view rules that apply inside or outside Framework/ (None if no rule applies)."""
+    alternatives = [
+        f'(?P<{group}>{VIEW_VIOLATIONS[name]["pattern"]})'
+        for group, name in _VIEW_GROUP_NAMES.items()
+        if not (in_framework and _VIEW_RULES[name].exclude_in_framework)
+    ]
+    return re.compile('|'.join(alternatives)) if alternatives else None
+
+# Rules excluded in framework code are dropped once per file, not per match
+_VIEW_RE = _build_view_re(in_framework=False)
+_VIEW_RE_IN_FRAMEWORK = _build_view_re(in_framework=True)
+
+def _build_re2_patterns(patterns) -> Dict[re.Pattern, object]:
+    """
+    RE2 (google-re2) twins of the rule alternations, keyed by the re pattern.
+
+    Empty without google-re2, or for a pattern RE2 can't compile; those
+    alternations are scanned with re alone.
+    """
+    if not RE2_AVAILABLE:
+        return {}
+    twins = {}
+    for pattern in patterns:
+        if pattern is None:
+            continue
+        try:
+            twins[pattern] = re2.compile(pattern.pattern)
+        except Exception:
+            continue
+    return twins
+
+_RE2_PATTERNS = _build_re2_patterns((_PLATFORM_TYPE_RE, _VIEW_RE, _VIEW_RE_IN_FRAMEWORK))
+
+def _finditer(pattern: re.Pattern, text: str):
+    """
+    pattern.finditer(text), driven by the linear-time RE2 twin when available.
+
+    RE2's \b only knows ASCII word characters, so it can report extra hits
+    next to non-ASCII letters (never fewer). Each hit is confirmed with re
+    at the same position, which also yields a regular re.Match.
+    """
+    twin = _RE2_PATTERNS.get(pattern)
+    if twin is None:
+        yield from pattern.finditer(text)
+        return
+    for candidate in twin.finditer(text):
+        match = pattern.match(text, candidate.start())
+        if match is not None:
+            yield match
+
+# Literal identifiers every match must contain (the PRIORITY 1 names and the
+# leading identifier of each PRIORITY 2 pattern). Lines containing none of
+# them cannot match and skip stripping and the regex alternations entirely.
+_VIEW_LITERALS = [re.match(r'\\b(\w+)', info['pattern']).group(1) for info in VIEW_VIOLATIONS.values()]
+_LITERALS = tuple(PLATFORM_TYPE_VIOLATIONS) + tuple(_VIEW_LITERALS)
+
+def _build_automaton(words: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over words, or None without pyahocorasick."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+_LITERAL_AUTOMATON = _build_automaton(_LITERALS)
+
+def _has_literal(line: str) -> bool:
+    """Return whether line contains any rule literal (Aho-Corasick if available, else substring probes)."""
+    if _LITERAL_AUTOMATON is not None:
+        return next(_LITERAL_AUTOMATON.iter(line), None) is not None
+    return any(literal in line for literal in _LITERALS)
+
+# Byte-level form of the literal prefilter, run over a memory-mapped file
+_LITERAL_BYTES_RE = re.compile(_trie_pattern(_LITERALS).encode('ascii'))
+
+def _read_candidate_text(file_path: str, require_literal: bool = True) -> Optional[str]:
+    """
+    Read a file through a memory map and decode it once.
+
+    With require_literal, files that contain no rule literal return None
+    without being decoded. Invalid UTF-8 is decoded with U+FFFD replacement
+    characters, so such files are still scanned. Newlines are normalized to
+    '\n' as in text mode.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if require_literal and not _LITERAL_BYTES_RE.search(mm):
+                return None
+            text = str(mm, 'utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+# Whether any PRIORITY 2 rule needs surrounding-line context; only then are
+# comment-stripped lines kept for the whole file.
+_CONTEXT_REQUIRED = any(rule.context_pattern is not None for rule in _VIEW_RULES.values())
+
 # ============================================================================
 # Data Structures
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     file_path: str
     line_number: int
@@ -461,9 +597,20 @@ class Violation:
     exception_reason: str = ""
 
     def to_dict(self):
-        return asdict(self)
-
-@dataclass
+        return {
+            'file_path': self.file_path,
+            'line_number': self.line_number,
+            'line_content': self.line_content,
+            'violation_type': self.violation_type,
+            'replacement': self.replacement,
+            'hint': self.hint,
+            'priority': self.priority,
+            'column': self.column,
+            'is_exception': self.is_exception,
+            'exception_reason': self.exception_reason
+        }
+
+@dataclass(slots=True)
 class AllowedException:
     file_path: str
     line_number: int
@@ -472,93 +619,106 @@ class AllowedException:
     reason: str
 
     def to_dict(self):
-        return asdict(self)
-
-@dataclass
+        return {
+            'file_path': self.file_path,
+            'line_number': self.line_number,
+            'line_content': self.line_content,
+            'violation_type': self.violation_type,
+            'reason': self.reason
+        }
+
+@dataclass(slots=True)
 class Exclusion:
     file_path: str
     reason: str
 
     def to_dict(self):
-        return asdict(self)
+        return {'file_path': self.file_path, 'reason': self.reason}
 
 # ============================================================================
 # Comment Stripping
 # ============================================================================
 
-def strip_comments_from_line(line: str, in_multiline_comment: bool = False) -> Tuple[str, bool]:
+# Tokens of a line outside multi-line comments: a string literal (possibly
+# unterminated, running to the end of the line), a comment opener, a run of
+# ordinary characters, or a lone '/'.
+_COMMENT_TOKEN_RE = re.compile(
+    r'"(?:\\.?|[^"\\])*"?'
+    r"|'(?:\\.?|[^'\\])*'?"
+    r'|//|/\*'
+    r'|[^/"\']+'
+    r'|/',
+    re.DOTALL
+)
+
+def _strip_line(
+    line: str,
+    in_multiline: bool = False,
+    strip_comments: bool = True,
+    replace_strings: bool = False
+) -> Tuple[str, bool]:
     """
-    Strip comments from a single line of Swift code.
-    
-    Returns:
-        Tuple of (line_without_comments, new_in_multiline_comment_state)
+    Single tokenizing pass shared by the comment and string-literal strippers.
+
+    Comments are dropped when strip_comments is set; string literals are kept
+    verbatim, or replaced by "STRING_LITERAL" when replace_strings is set.
     """
-    result = []
+    # Most lines have nothing to strip; they are returned as is
+    if not in_multiline and '/' not in line and '"' not in line and "'" not in line:
+        return (line, False)
+
+    # Kept text is collected as slices of the input, flushed only when a
+    # comment or string literal interrupts it
+    segments = []
+    start = 0
     i = 0
-    in_string = False
-    string_char = None
-    in_multiline = in_multiline_comment
-    
-    while i < len(line):
-        char = line[i]
-        next_char = line[i + 1] if i + 1 < len(line) else None
-        prev_char = line[i - 1] if i > 0 else None
-        
-        # Handle string literals (don't process comments inside strings)
-        if not in_string and (char == '"' or char == "'"):
-            in_string = True
-            string_char = char
-            result.append(char)
-            i += 1
-            continue
-        elif in_string:
-            # Check for escaped characters in strings
-            if char == '\\' and next_char:
-                # Escaped character, keep both
-                result.append(char)
-                result.append(next_char)
-                i += 2
-                continue
-            elif char == string_char:
-                # End of string
-                in_string = False
-                string_char = None
-                result.append(char)
-                i += 1
-                continue
-            else:
-                # Regular character in string
-                result.append(char)
-                i += 1
-                continue
-        
-        # Handle multi-line comment start (only if not in string)
-        if not in_multiline and not in_string and char == '/' and next_char == '*':
-            in_multiline = True
-            i += 2
-            continue
-        
-        # Handle multi-line comment end
-        if in_multiline and char == '*' and next_char == '/':
+    n = len(line)
+
+    while i < n:
+        # Inside a multi-line comment everything up to the closing */ is dropped
+        if in_multiline:
+            end = line.find('*/', i)
+            if end == -1:
+                return (''.join(segments), True)
             in_multiline = False
-            i += 2
+            i = start = end + 2
             continue
-        
-        # Handle single-line comment (only if not in multi-line or string)
-        if not in_multiline and not in_string and char == '/' and next_char == '/':
-            # Everything after // is a comment, stop processing
-            break
-        
-        # If we're in a multi-line comment, skip this character
-        if in_multiline:
-            i += 1
+
+        match = _COMMENT_TOKEN_RE.match(line, i)
+        token = match.group()
+
+        if strip_comments:
+            if token == '//':
+                # Everything after // is a comment, stop processing
+                segments.append(line[start:i])
+                return (''.join(segments), False)
+            if token == '/*':
+                segments.append(line[start:i])
+                in_multiline = True
+                i = start = match.end()
+                continue
+
+        if replace_strings and (token[0] == '"' or token[0] == "'"):
+            # Replace the entire string literal with a placeholder
+            segments.append(line[start:i])
+            segments.append('"STRING_LITERAL"')
+            i = start = match.end()
             continue
-        
-        # Regular character, keep it
-        result.append(char)
-        i += 1
+
+        # Regular characters (and kept string literals) extend the current run
+        i = match.end()
+
+    segments.append(line[start:])
+    return (''.join(segments), in_multiline)
+
+def strip_comments_from_line(line: str, in_multiline_comment: bool = False) -> Tuple[str, bool]:
+    """
+    Strip comments from a single line of Swift code.
     
-    return (''.join(result), in_multiline)
+    Returns:
+        Tuple of (line_without_comments, new_in_multiline_comment_state)
+    """
+    return _strip_line(line, in_multiline_comment)
 
 def strip_comments_from_lines(lines: List[str]) -> List[str]:
     """
@@ -597,40 +757,37 @@ def strip_string_literals_from_line(line: str) -> str:
     Returns:
         Line with string literals replaced by placeholders
     """
+    return _strip_line(line, strip_comments=False, replace_strings=True)[0]
+
+def strip_comments_and_strings_from_line(line: str, in_multiline_comment: bool = False) -> Tuple[str, bool]:
+    """
+    Strip comments and replace string literals with placeholders in one pass.
+
+    Equivalent to strip_comments_from_line followed by
+    strip_string_literals_from_line, without the second scan.
+
+    Returns:
+        Tuple of (stripped_line, new_in_multiline_comment_state)
+    """
+    return _strip_line(line, in_multiline_comment, replace_strings=True)
+
+def strip_comments_and_strings_from_lines(lines: List[str]) -> List[str]:
+    """
+    Strip comments and string literals from all lines in a single pass.
+
+    Returns:
+        List of lines with comments removed and string literals replaced by placeholders
+    """
     result = []
-    i = 0
+    in_multiline = False
 
-    while i < len(line):
-        char = line[i]
-        next_char = line[i + 1] if i + 1 < len(line) else None
+    for line in lines:
+        stripped, in_multiline = strip_comments_and_strings_from_line(line, in_multiline)
+        result.append(stripped)
 
-        # Handle string literals
-        if char == '"' or char == "'":
-            string_char = char
-            # Replace the entire string literal with a placeholder
-            result.append('"STRING_LITERAL"')
-            i += 1
-
-            # Skip to the end of the string literal
-            while i < len(line):
-                char = line[i]
-                if char == '\\' and next_char:
-                    # Escaped character, skip both
-                    i += 2
-                    next_char = line[i + 1] if i + 1 < len(line) else None
-                    continue
-                elif char == string_char:
-                    # End of string
-                    i += 1
-                    break
-                else:
-                    i += 1
-            continue
-        else:
-            result.append(char)
-            i += 1
+    return result
 
-    return ''.join(result)
+ALLOW_MARKER = "// 6LAYER_ALLOW:"
 
 def get_exception_reason(lines: List[str], line_idx: int) -> str:
     """
@@ -642,221 +799,683 @@ def get_exception_reason(lines: List[str], line_idx: int) -> str:
     if line_idx < 0 or line_idx >= len(lines):
         return ""
 
-    current_line = lines[line_idx].strip()
-    prev_line = lines[line_idx - 1].strip() if line_idx > 0 else ""
+    carried = _allow_reasons(lines[line_idx - 1], "")[1] if line_idx > 0 else ""
+    return _allow_reasons(lines[line_idx], carried)[0]
 
-    # Check for exception comment on current line (inline)
-    if "// 6LAYER_ALLOW:" in current_line:
-        return current_line.split("// 6LAYER_ALLOW:", 1)[1].strip()
+def precompute_exception_reasons(lines: List[str]) -> List[str]:
+    """
+    Exception reasons for every line in one linear pass.
 
-    # Check for exception comment on previous line
-    if prev_line.startswith("// 6LAYER_ALLOW:"):
-        return prev_line.split("// 6LAYER_ALLOW:", 1)[1].strip()
+    reasons[i] == get_exception_reason(lines, i), without re-checking each
+    line a second time as the "previous" line of its successor.
+    """
+    reasons = []
+    carried = ""
+    for line in lines:
+        reason, carried = _allow_reasons(line, carried)
+        reasons.append(reason)
+    return reasons
 
-    return ""
+def _allow_reasons(line: str, carried: str) -> Tuple[str, str]:
+    """
+    Resolve exception comments for one line.
+
+    carried is the reason a previous-line comment passes on to this line.
+    Returns (reason_for_this_line, reason_carried_to_next_line).
+    """
+    # The substring test rejects almost every line before any stripping
+    if ALLOW_MARKER not in line:
+        return carried, ""
+
+    # Inline comment wins over the previous line, even with an empty reason
+    reason = line.split(ALLOW_MARKER, 1)[1].strip()
+
+    # Only a line that starts with the comment covers the line below it
+    if line.lstrip().startswith(ALLOW_MARKER):
+        return reason, reason
+    return reason, ""
 
 # ============================================================================
 # Detection Logic
 # ============================================================================
 
-def is_app_code_with_reason(file_path: Path, exclude_framework: bool = True, exclude_tests: bool = False) -> Tuple[bool, str]:
-    """Check if file is app code (not framework/test code). Returns (is_app_code, exclusion_reason)."""
-    path_str = str(file_path)
-
-    # Exclude build directories and dependencies
-    if '.build' in path_str or '.build-clean' in path_str:
-        return False, "build directory"
-    if 'DerivedData' in path_str:
-        return False, "DerivedData directory"
-    if 'Pods/' in path_str:
-        return False, "Pods directory"
-    if 'Carthage/' in path_str:
-        return False, "Carthage directory"
-    if '.swiftpm/' in path_str:
-        return False, "Swift Package Manager directory"
-
-    # Exclude framework code
+# Path substrings that exclude a file, in priority order: when several
+# match, the first entry supplies the reason. '.build' also covers
+# '.build-clean', and 'scripts/' covers 'Development/scripts/'.
+_BUILD_PATH_RULES = (
+    ('.build', "build directory"),
+    ('DerivedData', "DerivedData directory"),
+    ('Pods/', "Pods directory"),
+    ('Carthage/', "Carthage directory"),
+    ('.swiftpm/', "Swift Package Manager directory"),
+)
+_FRAMEWORK_PATH_RULES = (
+    ('Framework/', "framework code"),
+    ('scripts/', "script file"),
+)
+_TEST_PATH_RULES = (
+    ('Development/Tests/', "test code"),
+)
+
+def _excluded_path_matcher(exclude_framework: bool, exclude_tests: bool):
+    rules = _BUILD_PATH_RULES
     if exclude_framework:
-        if 'Framework/' in path_str:
-            return False, "framework code"
-        if 'Development/scripts/' in path_str:
-            return False, "script file"
-        if 'scripts/' in path_str:
-            return False, "script file"
-
-    # Exclude test code (separately controllable)
+        rules += _FRAMEWORK_PATH_RULES
     if exclude_tests:
-        if 'Development/Tests/' in path_str:
-            return False, "test code"
+        rules += _TEST_PATH_RULES
+    return re.compile('|'.join(re.escape(needle) for needle, _ in rules)).search, rules
+
+# One matcher per flag combination, so a path that is not excluded is
+# rejected with a single regex scan.
+_EXCLUDED_PATH_MATCHERS = {
+    (ef, et): _excluded_path_matcher(ef, et)
+    for ef in (False, True) for et in (False, True)
+}
+
+def excluded_path_reason(path_str: str, exclude_framework: bool = True, exclude_tests: bool = False) -> str:
+    """
+    Return why a path is excluded from scanning, or "" if it isn't.
+
+    The checks are substring tests, so a directory path given with a
+    trailing '/' is excluded exactly when every file below it would be.
+    """
+    search, rules = _EXCLUDED_PATH_MATCHERS[bool(exclude_framework), bool(exclude_tests)]
+    if search(path_str) is None:
+        return ""
+    # The leftmost match need not be the highest-priority one, so pick
+    # the reason in rule order.
+    for needle, reason in rules:
+        if needle in path_str:
+            return reason
+    return ""
+
+def is_app_code_with_reason(file_path: Union[str, Path], exclude_framework: bool = True, exclude_tests: bool = False) -> Tuple[bool, str]:
+    """Check if file is app code (not framework/test code). Returns (is_app_code, exclusion_reason)."""
+    path_str = str(file_path)
+    exclusion_reason = excluded_path_reason(path_str, exclude_framework, exclude_tests)
+    if exclusion_reason:
+        return False, exclusion_reason
 
     # Only process Swift files
-    if not file_path.suffix == '.swift':
+    if not os.path.splitext(path_str)[1] == '.swift':
         return False, "not a Swift file"
 
     return True, ""
 
-def find_violations_in_file(file_path: Path, exclude_framework: bool = True, exclude_tests: bool = False) -> Tuple[List[Violation], List[Exclusion], List[AllowedException]]:
+def _match_stripped_lines(
+    stripped_lines: List[str],
+    view_re: Optional[re.Pattern]
+) -> Dict[int, Tuple[Dict[str, List[int]], Dict[str, int]]]:
+    """
+    Run both rule alternations once over all candidate lines of a file.
+
+    The lines are joined with NUL separators, which no rule pattern can
+    match across and which behave like a line boundary for \b, so each
+    alternation is one finditer call per file instead of one per line.
+    Match offsets are mapped back to (line index, column) via bisect.
+
+    Returns {line_index: (platform_columns, view_columns)} for lines with
+    matches; platform_columns lists every match column per PRIORITY 1 rule,
+    view_columns the first match column per PRIORITY 2 rule, both in order
+    of first appearance.
+    """
+    line_starts = []
+    offset = 0
+    for line in stripped_lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+    blob = '\0'.join(stripped_lines)
+
+    matches = {}
+    for match in _finditer(_PLATFORM_TYPE_RE, blob):
+        idx = bisect_right(line_starts, match.start()) - 1
+        platform_columns = matches.setdefault(idx, ({}, {}))[0]
+        platform_columns.setdefault(match.group(1), []).append(match.start() - line_starts[idx] + 1)
+
+    if view_re is not None:
+        for match in _finditer(view_re, blob):
+            idx = bisect_right(line_starts, match.start()) - 1
+            view_columns = matches.setdefault(idx, ({}, {}))[1]
+            view_columns.setdefault(_VIEW_GROUP_NAMES[match.lastgroup], match.start() - line_starts[idx] + 1)
+
+    return matches
+
+def _find_violations_in_line(
+    file_path: str,
+    line_num: int,
+    original_line: str,
+    exception_reason: str,
+    stripped_line: str,
+    platform_columns: Dict[str, List[int]],
+    view_columns: Dict[str, int],
+    violations: List[Violation],
+    exceptions: List[AllowedException],
+    pending_context: List[Tuple[int, Rule, Violation]]
+) -> None:
+    """Turn one line's rule matches into violations or allowed exceptions."""
+    # Shared by every record reported for this line
+    line_content = original_line.rstrip()
+
+    # Check for platform-specific type violations (PRIORITY 1)
+    for violation_name, columns in platform_columns.items():
+        rule = _PLATFORM_TYPE_RULES[violation_name]
+
+        # Check if this line has an exception comment
+        if exception_reason:
+            exceptions.append(AllowedException(
+                file_path=file_path,
+                line_number=line_num,
+                line_content=line_content,
+                violation_type=violation_name,
+                reason=exception_reason
+            ))
+            continue
+
+        # Check if this line should be excluded based on exclude patterns
+        should_exclude = False
+        for exclude_pattern in rule.exclude_patterns:
+            if exclude_pattern.search(stripped_line):
+                should_exclude = True
+                break
+
+        if should_exclude:
+            continue
+
+        # Found a violation
+        for column in columns:
+            violations.append(Violation(
+                file_path=file_path,
+                line_number=line_num,
+                line_content=line_content,
+                violation_type=violation_name,
+                replacement=rule.replacement,
+                hint=rule.hint,
+                priority=rule.priority,
+                column=column
+            ))
+
+    # Check for view violations (PRIORITY 2)
+    # Only the first match of each rule on a line is reported
+    for violation_name, column in view_columns.items():
+        rule = _VIEW_RULES[violation_name]
+
+        # Check if this line has an exception comment
+        if exception_reason:
+            exceptions.append(AllowedException(
+                file_path=file_path,
+                line_number=line_num,
+                line_content=line_content,
+                violation_type=violation_name,
+                reason=exception_reason
+            ))
+            continue
+
+        # Check if this line should be excluded based on exclude patterns
+        should_exclude = False
+        for exclude_pattern in rule.exclude_patterns:
+            if exclude_pattern.search(stripped_line):
+                should_exclude = True
+                break
+
+        if should_exclude:
+            continue
+
+        violation = Violation(
+            file_path=file_path,
+            line_number=line_num,
+            line_content=line_content,
+            violation_type=violation_name,
+            replacement=rule.replacement,
+            hint=rule.hint,
+            priority=rule.priority,
+            column=column
+        )
+
+        # If context is required, it is checked once the whole file is read
+        if rule.context_pattern is not None:
+            pending_context.append((line_num, rule, violation))
+            continue
+
+        # Found a violation
+        violations.append(violation)
+
+def find_violations_in_file(file_path: Union[str, Path], exclude_framework: bool = True, exclude_tests: bool = False) -> Tuple[List[Violation], List[Exclusion], List[AllowedException]]:
     """Scan a single file for violations."""
     violations = []
     exclusions = []
     exceptions = []
 
-    is_app, exclusion_reason = is_app_code_with_reason(file_path, exclude_framework, exclude_tests)
+    # Paths stay plain strings from here on; Path is accepted for callers
+    path_str = str(file_path)
+    is_app, exclusion_reason = is_app_code_with_reason(path_str, exclude_framework, exclude_tests)
     if not is_app:
-        exclusions.append(Exclusion(str(file_path), exclusion_reason))
+        exclusions.append(Exclusion(path_str, exclusion_reason))
         return violations, exclusions, exceptions
 
+    # View rules that apply to this file; framework code drops those marked exclude_in_framework
+    view_re = _VIEW_RE_IN_FRAMEWORK if 'Framework/' in path_str else _VIEW_RE
+    lines_without_comments = []
+    pending_context = []
+    # Lines that may match, as (line_num, original_line, exception_reason)
+    # plus their stripped text; matched all at once after reading
+    candidates = []
+    stripped_lines = []
+
+    # Exception comments are resolved line by line as the file is walked
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            content = ''.join(lines)
+        # Files without any rule literal (most of them) are ruled out on the
+        # mapped bytes, before anything is decoded
+        text = _read_candidate_text(path_str, require_literal=not _CONTEXT_REQUIRED)
+        if text is None:
+            return violations, exclusions, exceptions
+
+        # Lines are kept without their newline; only the context lines need it
+        lines = text.split('\n')
+        if not lines[-1]:
+            # The file ends with a newline
+            lines.pop()
+        last_ending = '\n' if text.endswith('\n') else ''
+
+        in_multiline = False
+        carried_reason = ""
+        for line_num, original_line in enumerate(lines, start=1):
+            exception_reason, carried_reason = _allow_reasons(original_line, carried_reason)
+
+            # A line without any rule literal cannot match. It can be
+            # skipped unless it may open or close a multi-line comment.
+            if (not _CONTEXT_REQUIRED
+                    and not _has_literal(original_line)
+                    and ('*/' if in_multiline else '/*') not in original_line):
+                continue
+
+            # Strip comments and string literals for violation detection
+            # Keep original line for display in violation reports
+            if _CONTEXT_REQUIRED:
+                # Context patterns are matched against lines that still
+                # contain their string literals
+                ending = '\n' if line_num < len(lines) else last_ending
+                line_without_comments, in_multiline = strip_comments_from_line(original_line + ending, in_multiline)
+                stripped_line = strip_string_literals_from_line(line_without_comments).rstrip('\n')
+                lines_without_comments.append(line_without_comments)
+            else:
+                stripped_line, in_multiline = strip_comments_and_strings_from_line(original_line, in_multiline)
+
+            candidates.append((line_num, original_line, exception_reason))
+            stripped_lines.append(stripped_line)
     except Exception as e:
-        print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
-        return violations, exclusions, exceptions
+        print(f"Warning: Could not read {path_str}: {e}", file=sys.stderr)
+        return [], exclusions, []
+
+    for idx, (platform_columns, view_columns) in sorted(_match_stripped_lines(stripped_lines, view_re).items()):
+        line_num, original_line, exception_reason = candidates[idx]
+        _find_violations_in_line(
+            path_str, line_num, original_line, exception_reason, stripped_lines[idx],
+            platform_columns, view_columns, violations, exceptions, pending_context
+        )
+
+    # Context-dependent view violations need lines on both sides of the match.
+    # Windows are sliced from one joined copy of the file, and each
+    # (rule, window) pair is searched only once.
+    if pending_context:
+        context_text = ''.join(lines_without_comments)
+        line_offsets = [0]
+        for line in lines_without_comments:
+            line_offsets.append(line_offsets[-1] + len(line))
+        context_found = {}
+        for line_num, rule, violation in pending_context:
+            start = max(0, line_num - 10)
+            end = min(len(lines_without_comments), line_num + 10)
+            key = (rule.name, start, end)
+            if key not in context_found:
+                window = context_text[line_offsets[start]:line_offsets[end]]
+                context_found[key] = rule.context_pattern.search(window) is not None
+            if context_found[key]:
+                violations.append(violation)
 
-    # Strip comments and string literals from lines for violation detection
-    # Keep original lines for display in violation reports
-    lines_without_comments = strip_comments_from_lines(lines)
-    lines_without_strings = strip_string_literals_from_lines(lines_without_comments)
+    return violations, exclusions, exceptions
 
-    # Check for platform-specific type violations (PRIORITY 1)
-    for violation_name, violation_info in PLATFORM_TYPE_VIOLATIONS.items():
-        pattern = violation_info['pattern']
-        exclude_patterns = violation_info.get('exclude_patterns', [])
-        for line_num, (original_line, stripped_line) in enumerate(zip(lines, lines_without_strings), start=1):
-            if re.search(pattern, stripped_line):
-                # Check if this line has an exception comment
-                exception_reason = get_exception_reason(lines, line_num - 1)
-                if exception_reason:
-                    exceptions.append(AllowedException(
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        line_content=original_line.rstrip(),
-                        violation_type=violation_name,
-                        reason=exception_reason
-                    ))
-                    continue
+# ============================================================================
+# Result Cache
+# ============================================================================
 
-                # Check if this line should be excluded based on exclude patterns
-                should_exclude = False
-                for exclude_pattern in exclude_patterns:
-                    if re.search(exclude_pattern, stripped_line):
-                        should_exclude = True
-                        break
+DEFAULT_CACHE_FILE = Path('.sixlayer-lint-cache') / 'v1.json'
 
-                if should_exclude:
-                    continue
+# Bumped whenever detection logic changes in a way the rule tables don't show
+CACHE_VERSION = 2
 
-                # Found a violation
-                matches = list(re.finditer(pattern, stripped_line))
-                for match in matches:
-                    violations.append(Violation(
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        line_content=original_line.rstrip(),
-                        violation_type=violation_name,
-                        replacement=violation_info['replacement'],
-                        hint=violation_info['hint'],
-                        priority=violation_info['priority'],
-                        column=match.start() + 1
-                    ))
+def _rules_fingerprint() -> str:
+    """Hash of the rule tables; a cache written under other rules is discarded."""
+    rules = [CACHE_VERSION, PLATFORM_TYPE_VIOLATIONS, VIEW_VIOLATIONS]
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()
 
-    # Check for view violations (PRIORITY 2)
-    for violation_name, violation_info in VIEW_VIOLATIONS.items():
-        pattern = violation_info['pattern']
-        context_pattern = violation_info.get('context_pattern')
-        requires_context = violation_info.get('requires_context', False)
-        exclude_patterns = violation_info.get('exclude_patterns', [])
+def load_cache(cache_file: Path) -> Tuple[Dict[str, Dict], Dict[str, List]]:
+    """
+    Load cached per-file results and the stat index, or empty ones if the
+    cache is missing, unreadable or stale.
 
-        # Check if we should exclude framework code for this violation
-        if violation_info.get('exclude_in_framework', False) and 'Framework/' in str(file_path):
-            continue
+    Results are keyed by content hash; the stat index maps a path to
+    [mtime_ns, size, content_hash] so unchanged files needn't be re-hashed.
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(data, dict) or data.get('fingerprint') != _rules_fingerprint():
+        return {}, {}
+    return data.get('files', {}), data.get('stats', {})
+
+def save_cache(cache_file: Path, entries: Dict[str, Dict], stats: Dict[str, List]) -> None:
+    """Write the cache atomically; failures only cost the next run a rescan."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': _rules_fingerprint(), 'files': entries, 'stats': stats}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_file}: {e}", file=sys.stderr)
+
+# Files modified this recently may change again within the same mtime tick
+# without changing size, so their stat isn't trusted on the next run
+_RACY_MTIME_NS = 2_000_000_000
+
+def _cache_key(path_str: str, known_stats: Dict[str, List], seen_stats: Dict[str, List]) -> Optional[str]:
+    """
+    Content hash of a file, or None if it can't be cached.
 
-        for line_num, (original_line, stripped_line) in enumerate(zip(lines, lines_without_strings), start=1):
-            if re.search(pattern, stripped_line):
-                # Check if this line has an exception comment
-                exception_reason = get_exception_reason(lines, line_num - 1)
-                if exception_reason:
-                    exceptions.append(AllowedException(
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        line_content=original_line.rstrip(),
-                        violation_type=violation_name,
-                        reason=exception_reason
-                    ))
-                    continue
+    A file whose mtime and size match known_stats reuses the recorded hash
+    without being read. Trustworthy stats are recorded in seen_stats.
+    """
+    try:
+        st = os.stat(path_str)
+    except OSError:
+        return None
+    known = known_stats.get(path_str)
+    if known and known[0] == st.st_mtime_ns and known[1] == st.st_size:
+        seen_stats[path_str] = known
+        return known[2]
 
-                # Check if this line should be excluded based on exclude patterns
-                should_exclude = False
-                for exclude_pattern in exclude_patterns:
-                    if re.search(exclude_pattern, stripped_line):
-                        should_exclude = True
-                        break
+    try:
+        with open(path_str, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    # Framework/ paths change which view rules apply, so they key separately
+    in_framework = b'1' if 'Framework/' in path_str else b'0'
+    key = hashlib.sha256(in_framework + data).hexdigest()
+    if time.time_ns() - st.st_mtime_ns > _RACY_MTIME_NS:
+        seen_stats[path_str] = [st.st_mtime_ns, st.st_size, key]
+    return key
+
+def _cache_entry(violations: List[Violation], exceptions: List[AllowedException]) -> Dict:
+    """Path-independent form of a file's results; identical files share an entry."""
+    def strip_path(item) -> Dict:
+        d = item.to_dict()
+        del d['file_path']
+        return d
+    return {
+        'violations': [strip_path(v) for v in violations],
+        'exceptions': [strip_path(e) for e in exceptions],
+    }
 
-                if should_exclude:
-                    continue
+def _from_cache_entry(path_str: str, entry: Dict) -> Tuple[List[Violation], List[Exclusion], List[AllowedException]]:
+    return (
+        [Violation(file_path=path_str, **d) for d in entry['violations']],
+        [],
+        [AllowedException(file_path=path_str, **d) for d in entry['exceptions']],
+    )
 
-                # If context is required, check if it exists nearby
-                if requires_context and context_pattern:
-                    # Check surrounding lines for context (use stripped lines for context check)
-                    context_found = False
-                    start = max(0, line_num - 10)
-                    end = min(len(lines_without_comments), line_num + 10)
-                    context_lines = ''.join(lines_without_comments[start:end])
-                    if re.search(context_pattern, context_lines):
-                        context_found = True
-
-                    if not context_found:
-                        continue
-
-                # Found a violation
-                match = re.search(pattern, stripped_line)
-                if match:
-                    violations.append(Violation(
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        line_content=original_line.rstrip(),
-                        violation_type=violation_name,
-                        replacement=violation_info['replacement'],
-                        hint=violation_info['hint'],
-                        priority=violation_info['priority'],
-                        column=match.start() + 1
-                    ))
+def _scan_dir_entries(
+    directory: str,
+    exclude_dir: Optional[Callable[[str], str]] = None
+) -> Tuple[List[str], List[str], List[Exclusion]]:
+    """
+    List one directory without following symlinks.
 
-    return violations, exclusions, exceptions
+    Returns (swift_files, subdirectories, excluded_subdirectories); a
+    subdirectory is excluded when exclude_dir gives a reason for it.
+    """
+    swift_files = []
+    subdirs = []
+    excluded = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    reason = exclude_dir(entry.path + '/') if exclude_dir else ""
+                    if reason:
+                        excluded.append(Exclusion(entry.path, reason))
+                    else:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.swift') and entry.is_file():
+                    swift_files.append(entry.path)
+    except OSError:
+        pass
+    return swift_files, subdirs, excluded
+
+def list_swift_files(
+    root: str,
+    exclude_dir: Optional[Callable[[str], str]] = None,
+    max_workers: int = 16
+) -> Tuple[List[str], List[Exclusion]]:
+    """
+    List all .swift files under root, skipping excluded directories.
 
-def scan_directory(directory: Path, exclude_framework: bool = True, exclude_tests: bool = False) -> Tuple[List[Violation], List[Exclusion], List[AllowedException]]:
-    """Scan a directory tree for violations."""
-    all_violations = []
-    all_exclusions = []
-    all_exceptions = []
+    exclude_dir maps a directory path (with a trailing '/') to an exclusion
+    reason, or "" to descend into it. Returns the files and one Exclusion
+    per pruned directory.
+
+    Each level of the tree is listed by a thread pool (scandir releases the
+    GIL), then the results are put back in depth-first order, the order
+    rglob would produce.
+    """
+    if exclude_dir:
+        reason = exclude_dir(root.rstrip('/') + '/')
+        if reason:
+            return [], [Exclusion(root, reason)]
+
+    listings = {}
+    level = [root]
+    scan = partial(_scan_dir_entries, exclude_dir=exclude_dir)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while level:
+            next_level = []
+            for directory, listing in zip(level, executor.map(scan, level)):
+                listings[directory] = listing
+                next_level.extend(listing[1])
+            level = next_level
 
+    result = []
+    pruned = []
+    stack = [root]
+    while stack:
+        swift_files, subdirs, excluded = listings[stack.pop()]
+        result.extend(swift_files)
+        pruned.extend(excluded)
+        stack.extend(reversed(subdirs))
+    return result, pruned
+
+# Smallest batch of files worth handing to one more worker process
+_MIN_FILES_PER_WORKER = 32
+
+def iter_scan_directory(
+    directory: Path,
+    exclude_framework: bool = True,
+    exclude_tests: bool = False,
+    cache_file: Optional[Path] = None,
+    jobs: Optional[int] = None
+) -> Iterator[Tuple[List[Violation], List[Exclusion], List[AllowedException]]]:
+    """
+    Scan a directory tree, yielding (violations, exclusions, exceptions) per file.
+
+    Results are yielded in file order as soon as each file is done, so
+    callers can stream them instead of holding the whole tree's results.
+    Pruned directories come first, as one batch of exclusions.
+
+    With cache_file, files whose content was scanned before reuse the cached
+    results, and the cache is rewritten with the entries seen in this run.
+    jobs is the maximum number of worker processes (default: one per CPU);
+    1, or too few files to share out, scans in this process.
+    """
     if not directory.exists():
         print(f"Error: Directory {directory} does not exist", file=sys.stderr)
-        return all_violations, all_exclusions, all_exceptions
+        return
 
-    swift_files = list(directory.rglob('*.swift'))
+    # Excluded trees (build output, dependencies, ...) are pruned during the
+    # walk and reported once per directory instead of once per file
+    exclude_dir = partial(excluded_path_reason, exclude_framework=exclude_framework, exclude_tests=exclude_tests)
+    swift_files, pruned_dirs = list_swift_files(str(directory), exclude_dir)
 
     print(f"Scanning {len(swift_files)} Swift files...", file=sys.stderr)
 
-    for swift_file in swift_files:
-        violations, exclusions, exceptions = find_violations_in_file(swift_file, exclude_framework, exclude_tests)
-        all_violations.extend(violations)
-        all_exclusions.extend(exclusions)
-        all_exceptions.extend(exceptions)
+    if pruned_dirs:
+        yield [], pruned_dirs, []
+
+    # Cache hits (and excluded files) are resolved up front; the rest are
+    # scanned in file order
+    known = [None] * len(swift_files)
+    to_scan = swift_files
+    keys = {}
+    seen_stats = {}
+    if cache_file is not None:
+        cache, known_stats = load_cache(cache_file)
+        to_scan = []
+        for i, swift_file in enumerate(swift_files):
+            is_app, exclusion_reason = is_app_code_with_reason(swift_file, exclude_framework, exclude_tests)
+            if not is_app:
+                known[i] = ([], [Exclusion(swift_file, exclusion_reason)], [])
+                continue
+            key = _cache_key(swift_file, known_stats, seen_stats)
+            if key is not None:
+                keys[i] = key
+                if key in cache:
+                    known[i] = _from_cache_entry(swift_file, cache[key])
+                    continue
+            to_scan.append(swift_file)
+
+    # Files are independent, so scan them across processes; map() keeps
+    # results in file order. A file scans in about a millisecond, so a worker
+    # only pays for its startup (a fresh interpreter under spawn) given a
+    # few dozen files, and a batch too small for two workers stays in-process
+    scan_file = partial(find_violations_in_file, exclude_framework=exclude_framework, exclude_tests=exclude_tests)
+    workers = min(jobs or os.cpu_count() or 1, len(to_scan) // _MIN_FILES_PER_WORKER)
+    with ExitStack() as stack:
+        if workers <= 1:
+            scanned = map(scan_file, to_scan)
+        else:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            scanned = executor.map(scan_file, to_scan, chunksize=16)
+
+        entries = {}
+        excluded_files = 0
+        for i in range(len(swift_files)):
+            result = known[i] if known[i] is not None else next(scanned)
+            violations, exclusions, exceptions = result
+            if exclusions:
+                excluded_files += 1
+            if i in keys:
+                entries[keys[i]] = _cache_entry(violations, exceptions)
+            yield result
+
+    if cache_file is not None:
+        save_cache(cache_file, entries, seen_stats)
 
     # Warn if all files were excluded - might indicate incorrect exclusion settings
-    if len(all_exclusions) == len(swift_files) and len(swift_files) > 0:
-        print(f"\n⚠️  Warning: All {len(swift_files)} Swift files in {directory} were excluded from scanning.", file=sys.stderr)
+    if (pruned_dirs or excluded_files) and excluded_files == len(swift_files):
+        print(f"\n⚠️  Warning: All Swift files in {directory} were excluded from scanning.", file=sys.stderr)
         print(f"   This might indicate that the exclusion settings are too restrictive for this directory.", file=sys.stderr)
         print(f"   Consider using --include-framework or --include-tests if you want to scan these files.", file=sys.stderr)
 
+def scan_directory(
+    directory: Path,
+    exclude_framework: bool = True,
+    exclude_tests: bool = False,
+    cache_file: Optional[Path] = None,
+    jobs: Optional[int] = None
+) -> Tuple[List[Violation], List[Exclusion], List[AllowedException]]:
+    """Scan a directory tree for violations (see iter_scan_directory)."""
+    all_violations = []
+    all_exclusions = []
+    all_exceptions = []
+
+    for violations, exclusions, exceptions in iter_scan_directory(
+        directory, exclude_framework, exclude_tests, cache_file=cache_file, jobs=jobs
+    ):
+        all_violations.extend(violations)
+        all_exclusions.extend(exclusions)
+        all_exceptions.extend(exceptions)
+
     return all_violations, all_exclusions, all_exceptions
 
 # ============================================================================
 # Output Formatting
 # ============================================================================
 
+def print_summary(priority_1_count: int, priority_2_count: int, exception_count: int, exclusion_reasons: Dict[str, int]):
+    """Print the report header with violation, exception and exclusion totals."""
+    violation_count = priority_1_count + priority_2_count
+    exclusion_count = sum(exclusion_reasons.values())
+
+    print(f"\n{'='*80}")
+    print(f"6-Layer Type Violations Report")
+    print(f"{'='*80}")
+    if violation_count:
+        print(f"Total violations: {violation_count}")
+        print(f"  Priority 1 (Platform-specific types): {priority_1_count}")
+        print(f"  Priority 2 (View usage): {priority_2_count}")
+    else:
+        print("Total violations: 0")
+
+    if exception_count:
+        print(f"Total allowed exceptions: {exception_count}")
+
+    if exclusion_count:
+        print(f"Total files/directories excluded: {exclusion_count}")
+        for reason, count in sorted(exclusion_reasons.items()):
+            print(f"  {count} excluded because of {reason}")
+    print(f"{'='*80}\n")
+
+def write_json_report(json_report: Dict, report_file: str) -> None:
+    """Write the JSON report, with orjson's C encoder when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(json_report, option=orjson.OPT_INDENT_2))
+        return
+    with open(report_file, 'w') as f:
+        json.dump(json_report, f, indent=2)
+
+def _ndjson_row(row: Dict) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE).decode('utf-8')
+    return json.dumps(row) + '\n'
+
+def write_ndjson_report(results, out) -> Tuple[int, int, int, Dict[str, int]]:
+    """
+    Write per-file results to out as newline-delimited JSON while they arrive.
+
+    Each row is a record's to_dict() plus a "record" field ("violation",
+    "exception" or "exclusion"). Only the totals are kept; returns
+    (priority_1_count, priority_2_count, exception_count, exclusion_reasons).
+    """
+    priority_counts = {1: 0, 2: 0}
+    exception_count = 0
+    exclusion_reasons = {}
+
+    for violations, exclusions, exceptions in results:
+        for record, items in (('violation', violations), ('exception', exceptions), ('exclusion', exclusions)):
+            for item in items:
+                row = item.to_dict()
+                row['record'] = record
+                out.write(_ndjson_row(row))
+        for violation in violations:
+            priority_counts[violation.priority] = priority_counts.get(violation.priority, 0) + 1
+        exception_count += len(exceptions)
+        for exclusion in exclusions:
+            exclusion_reasons[exclusion.reason] = exclusion_reasons.get(exclusion.reason, 0) + 1
+
+    return priority_counts[1], priority_counts[2], exception_count, exclusion_reasons
+
 def print_console_report(violations: List[Violation], exclusions: List[Exclusion] = None, exceptions: List[AllowedException] = None):
     """Print violations, exclusions, and exceptions to console."""
     if exclusions is None:
@@ -878,24 +1497,7 @@ def print_console_report(violations: List[Violation], exclusions: List[Exclusion
         reason = exclusion.reason
         exclusion_reasons[reason] = exclusion_reasons.get(reason, 0) + 1
 
-    print(f"\n{'='*80}")
-    print(f"6-Layer Type Violations Report")
-    print(f"{'='*80}")
-    if violations:
-        print(f"Total violations: {len(violations)}")
-        print(f"  Priority 1 (Platform-specific types): {len(priority_1)}")
-        print(f"  Priority 2 (View usage): {len(priority_2)}")
-    else:
-        print("Total violations: 0")
-
-    if exceptions:
-        print(f"Total allowed exceptions: {len(exceptions)}")
-
-    if exclusions:
-        print(f"Total files excluded: {len(exclusions)}")
-        for reason, count in sorted(exclusion_reasons.items()):
-            print(f"  {count} files excluded because of {reason}")
-    print(f"{'='*80}\n")
+    print_summary(len(priority_1), len(priority_2), len(exceptions), exclusion_reasons)
     
     # Print Priority 1 violations
     if priority_1:
@@ -991,11 +1593,18 @@ def main():
         default='.',
         help='Directory to scan (default: current directory)'
     )
-    parser.add_argument(
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
         '--json',
         type=str,
         help='Output JSON report to file'
     )
+    output_group.add_argument(
+        '--ndjson',
+        type=str,
+        metavar='FILE',
+        help='Stream results to FILE as newline-delimited JSON while scanning; only totals are printed'
+    )
     parser.add_argument(
         '--exclude-framework',
         action='store_true',
@@ -1020,20 +1629,63 @@ def main():
         dest='exclude_tests',
         help='Include Development/Tests/ code in scanning'
     )
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const=str(DEFAULT_CACHE_FILE),
+        default=None,
+        metavar='FILE',
+        help=f'Reuse results for unchanged files across runs (default file: {DEFAULT_CACHE_FILE})'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Maximum worker processes for directory scans (default: one per CPU; 1 disables the pool)'
+    )
     
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
 
     # Handle both directories and single files
     path = Path(args.directory).resolve()
+    cache_file = Path(args.cache) if args.cache else None
+
+    if args.ndjson:
+        # Streaming mode: nothing is accumulated, so only totals are printed
+        if path.is_file():
+            results = [find_violations_in_file(path, args.exclude_framework, args.exclude_tests)]
+        else:
+            results = iter_scan_directory(
+                path, exclude_framework=args.exclude_framework, exclude_tests=args.exclude_tests,
+                cache_file=cache_file, jobs=args.jobs
+            )
+        with open(args.ndjson, 'w') as f:
+            priority_1_count, priority_2_count, exception_count, exclusion_reasons = write_ndjson_report(results, f)
+        print_summary(priority_1_count, priority_2_count, exception_count, exclusion_reasons)
+        print(f"\n📄 NDJSON report written to: {args.ndjson}", file=sys.stderr)
+        sys.exit(1 if priority_1_count or priority_2_count else 0)
+
     if path.is_file():
         # Single file
         violations, exclusions, exceptions = find_violations_in_file(path, args.exclude_framework, args.exclude_tests)
     else:
         # Directory
-        violations, exclusions, exceptions = scan_directory(path, exclude_framework=args.exclude_framework, exclude_tests=args.exclude_tests)
+        violations, exclusions, exceptions = scan_directory(
+            path, exclude_framework=args.exclude_framework, exclude_tests=args.exclude_tests,
+            cache_file=cache_file, jobs=args.jobs
+        )
     
-    # Sort violations by priority, then by file
-    violations.sort(key=lambda v: (v.priority, v.file_path, v.line_number))
+    # Sort violations by priority, then by file: bucket by priority and sort
+    # each bucket, which is the same stable order without a tuple key per item
+    by_location = attrgetter('file_path', 'line_number')
+    priority_1 = [v for v in violations if v.priority == 1]
+    priority_2 = [v for v in violations if v.priority != 1]
+    priority_1.sort(key=by_location)
+    priority_2.sort(key=by_location)
+    violations = priority_1 + priority_2
     
     # Print console report
     print_console_report(violations, exclusions, exceptions)
@@ -1041,8 +1693,7 @@ def main():
     # Generate JSON report if requested
     if args.json:
         json_report = generate_json_report(violations, exclusions, exceptions)
-        with open(args.json, 'w') as f:
-            json.dump(json_report, f, indent=2)
+        write_json_report(json_report, args.json)
         print(f"\n📄 JSON report written to: {args.json}", file=sys.stderr)
     
     # Exit with error code if violations found
@@ -7,13 +7,19 @@ This script supports both .strings and .xcstrings formats:
 - For .strings: Translates missing keys per language (gap-filling)
 
 Features:
-- Multiple translation providers (Google, DeepL, Microsoft, MyMemory)
-- Periodic auto-saving (saves progress every N translations, default: 50)
+- Multiple translation providers (Google, DeepL, Microsoft, MyMemory), tried in order
+  when one fails (e.g. --provider google,deepl; MyMemory is always the last resort)
+- Periodic auto-saving (saves progress every N translations, default: 50; .xcstrings
+  progress goes to a Localizable.xcstrings.wal log that is folded in on the final save)
 - Resume capability (skips already-translated strings if restarted)
 - Optional backups before final save (use --backup flag)
 - Progress tracking with tqdm support (optional, graceful fallback)
 - Time estimation before starting
-- Rate limiting to respect API limits
+- Rate limiting to respect API limits (token bucket per provider, see --rps; throttled
+  requests are retried with exponential backoff)
+- Batched requests (several strings per API call, see --batch-size)
+- Concurrent requests on a bounded thread pool (see --concurrency)
+- Translation memory: translations are cached across runs in .translation-cache/
 - Safe for long-running jobs (20-40+ minutes)
 
 Usage:
@@ -29,6 +35,9 @@ Examples:
     # Use DeepL (requires API key)
     DEEPL_API_KEY=your_key python3 generate_missing_translations.py --base-dir Resources --provider deepl
 
+    # Use DeepL, falling back to Google when DeepL fails or rate limits
+    DEEPL_API_KEY=your_key python3 generate_missing_translations.py --base-dir Resources --provider deepl,google
+
     # Save more frequently (every 25 translations instead of 50)
     python3 generate_missing_translations.py --base-dir Resources --save-interval 25
 
@@ -44,32 +53,199 @@ simply restart it and it will resume from where it left off.
 
 import argparse
 import concurrent.futures
+import hashlib
+import itertools
 import json
 import os
+import random
+import sqlite3
 import sys
 import tempfile
+import threading
 import time
 import shutil
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Set, List, Optional, Tuple
 import re
 
+# A .strings entry: "key" = "value"; (the value pattern is written as runs of plain characters
+# between escapes, which matches the same text as (?:[^"\\]|\\.)* with far less backtracking)
+_STRINGS_RE = re.compile(r'"([^"]+)"\s*=\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*;')
+# A backslash escape inside a .strings value; unescaped in one pass so that "\\n" stays a
+# backslash followed by n, and escapes other than \n, \" and \\ are kept as written
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+_UNESCAPES = {'n': '\n', '"': '"', '\\': '\\'}
+
+# printf-style format specifiers as used by Foundation: %@, %d, %1$@, %.2f, %lld, %%. The space
+# and ' flags are left out, so percent signs in prose ("50% off", "100% sure") are not specifiers
+_FORMAT_SPECIFIER_RE = re.compile(r"%(?:\d+\$)?[-+0#]*(?:\d+|\*)?(?:\.(?:\d+|\*))?(?:hh|h|ll|l|q|L|z|t|j)?[@dioxXucsSfFeEgGaAp%]")
+_URL_RE = re.compile(r'\b(?:https?|ftp)://\S+|\bmailto:\S+')
+# Strings that are nothing but a bare format specifier or separator
+_UNTRANSLATABLE_STRINGS = frozenset([":", "%@", "%d", "%f", "%.2f", "%.3f", "%.4f"])
+# Stand-in for the Nth format specifier while a string is being translated; providers sometimes
+# add spaces or change case, so restoring accepts those variants
+_PLACEHOLDER_RE = re.compile(r'_\s*_\s*PH\s*(\d+)\s*_\s*_', re.IGNORECASE)
+
 # Timeout for a single translation request (avoids hanging on throttled/stuck API)
 TRANSLATE_REQUEST_TIMEOUT_SECONDS = 30
 
+# Strings sent together in one translation request (joined by newlines)
+DEFAULT_BATCH_SIZE = 50
+
+# Characters per batched request, kept under each provider's input limit
+BATCH_MAX_CHARS = {"google": 4500, "mymemory": 450}
+DEFAULT_BATCH_MAX_CHARS = 4500
+
+# Batches translated at the same time
+DEFAULT_CONCURRENCY = 8
+
+# Maximum requests per second sent to each provider (--rps overrides the primary provider's)
+DEFAULT_RPS = {"google": 20, "deepl": 10, "microsoft": 10, "mymemory": 1}
+# The rate is halved whenever the provider throttles (down to MIN_RPS) and raised by
+# RPS_INCREASE_STEP after every RPS_INCREASE_EVERY successful requests, up to the maximum
+MIN_RPS = 0.25
+RPS_INCREASE_STEP = 1.0
+RPS_INCREASE_EVERY = 50
+
+# Attempts per request when the provider throttles or the connection fails; the wait before
+# attempt n+1 is random up to min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**n)
+MAX_REQUEST_ATTEMPTS = 8
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30
+
+PROVIDERS = ("google", "deepl", "microsoft", "mymemory")
+# Environment variable holding the API key, for providers that need one
+PROVIDER_API_KEY_ENV = {"deepl": "DEEPL_API_KEY", "microsoft": "MICROSOFT_TRANSLATOR_API_KEY"}
+# A provider that keeps failing after retries is moved to the end of the fallback order for a while
+PROVIDER_FAILURE_THRESHOLD = 5
+PROVIDER_COOLDOWN_SECONDS = 60
+
+# Translation memory (SQLite), relative to the working directory
+DEFAULT_TM_FILE = Path('.translation-cache') / 'tm.sqlite3'
+# New translation memory rows are committed in groups of this many
+TM_COMMIT_EVERY = 100
+
 try:
+    import requests
+    import deep_translator.deepl
+    import deep_translator.google
+    import deep_translator.microsoft
+    import deep_translator.mymemory
     from deep_translator import GoogleTranslator, DeeplTranslator, MicrosoftTranslator, MyMemoryTranslator
+    from deep_translator.exceptions import RequestError, ServerException, TooManyRequests
+    TRANSLATOR_CLASSES = {
+        "google": GoogleTranslator,
+        "deepl": DeeplTranslator,
+        "microsoft": MicrosoftTranslator,
+        "mymemory": MyMemoryTranslator,
+    }
     TRANSLATION_AVAILABLE = True
 except ImportError:
     TRANSLATION_AVAILABLE = False
 
+# Per-thread HTTP session and translator instances
+_thread_state = threading.local()
+
+
+def _http_session() -> "requests.Session":
+    """Return this thread's requests.Session, which keeps connections to the provider open."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = requests.Session()
+    return session
+
+
+class _SessionRequests:
+    """Stand-in for the requests module inside deep_translator.
+
+    deep_translator calls requests.get/post directly, which opens a new connection
+    (and TLS handshake) per translation. Routing them through a per-thread Session
+    reuses the connection; everything else falls through to requests.
+    """
+
+    def get(self, *args, **kwargs):
+        return _http_session().get(*args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        return _http_session().post(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+if TRANSLATION_AVAILABLE:
+    for _module in (deep_translator.deepl, deep_translator.google, deep_translator.microsoft, deep_translator.mymemory):
+        if getattr(_module, "requests", None) is requests:
+            _module.requests = _SessionRequests()
+
 try:
     from tqdm import tqdm
     PROGRESS_AVAILABLE = True
 except ImportError:
     PROGRESS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class TokenBucket:
+    """Thread-safe rate limiter: acquire() blocks until a request may go out at rate per second,
+    with bursts of up to one second's worth. The rate adapts (AIMD) between MIN_RPS and max_rate:
+    halved by throttled(), raised step by step by succeeded().
+    """
+    
+    def __init__(self, rate: float):
+        self.max_rate = rate
+        self.rate = rate
+        self._tokens = max(1.0, rate)
+        self._updated = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+    
+    def succeeded(self):
+        with self._lock:
+            self._successes += 1
+            if self._successes >= RPS_INCREASE_EVERY and self.rate < self.max_rate:
+                self._successes = 0
+                self.rate = min(self.max_rate, self.rate + RPS_INCREASE_STEP)
+    
+    def throttled(self):
+        with self._lock:
+            self._successes = 0
+            self.rate = max(min(MIN_RPS, self.max_rate), self.rate / 2)
+            self._tokens = min(self._tokens, 1.0)
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(max(1.0, self.rate), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _is_throttled(error: Exception) -> bool:
+    """True when the provider rejected the request for exceeding its rate limit (HTTP 429)."""
+    # deep_translator's ServerException only keeps the status as a message
+    return isinstance(error, TooManyRequests) or (
+        isinstance(error, ServerException) and str(error) == "ERR_TOO_MANY_REQUESTS")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """True for errors worth retrying after a pause: throttling, server errors, connection problems."""
+    if _is_throttled(error) or isinstance(error, (RequestError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    return isinstance(error, ServerException) and str(error) in ("ERR_INTERNAL_SERVER_ERROR", "ERR_SERVICE_NOT_AVAIBLE")
+
 
 class LocalizationTranslator:
     """Translates localization files (.strings or .xcstrings) using machine translation."""
@@ -110,14 +286,27 @@ class LocalizationTranslator:
     
     def __init__(self, base_dir: Path, provider: str = "google", dry_run: bool = False,
                  save_interval: int = 50, mark_as_translated: bool = False, create_backup: bool = False,
-                 retry_needs_review: bool = False):
+                 retry_needs_review: bool = False, batch_size: int = DEFAULT_BATCH_SIZE,
+                 concurrency: int = DEFAULT_CONCURRENCY, tm_file: Optional[Path] = DEFAULT_TM_FILE,
+                 tm_ttl_days: Optional[float] = None, skip_filter: bool = True, rps: Optional[float] = None):
         self.base_dir = Path(base_dir)
-        self.provider = provider
+        # provider may be a comma-separated fallback order, e.g. "deepl,google"; the first is the primary
+        self.providers = [p.strip() for p in provider.split(",") if p.strip()]
+        self.provider = self.providers[0]
+        # MyMemory needs no API key, so it is always the last resort
+        self._provider_chain = self.providers if "mymemory" in self.providers else self.providers + ["mymemory"]
+        self._provider_lock = threading.Lock()
+        self._provider_failures = {p: 0 for p in self._provider_chain}  # Consecutive failures
+        self._provider_cooldown_until = {p: 0.0 for p in self._provider_chain}
         self.dry_run = dry_run
         self.save_interval = save_interval  # Save every N translations
         self.mark_as_translated = mark_as_translated  # If True, mark translations as "translated" instead of "needs_review"
+        self._translated_state = "translated" if mark_as_translated else "needs_review"
         self.create_backup = create_backup  # If True, create backups before saving
         self.retry_needs_review = retry_needs_review  # If True, re-translate entries marked needs_review
+        self.batch_size = max(1, batch_size)  # Strings per translation request
+        self.concurrency = max(1, concurrency)  # Batches in flight at once
+        self.skip_filter = skip_filter  # If True, don't send strings with nothing but specifiers/URLs/numbers/symbols
         self.translator = None
         self.file_format = None  # 'xcstrings' or 'strings'
         self.source_language = "en"
@@ -126,16 +315,49 @@ class LocalizationTranslator:
             "total_strings": 0,
             "translated": 0,
             "skipped": 0,
-            "errors": 0
+            "errors": 0,
+            "tm_hits": 0
         }
         self.last_save_count = 0
+        self._stats_lock = threading.Lock()
+        # Batches run on _pool; each batch makes its API calls, one at a time, on
+        # _request_pool so a hung call can be abandoned after the timeout
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency)
+        self._request_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency)
+        # One rate limiter per provider, shared by all threads (MyMemory is also the fallback)
+        self._rate_limiters = {name: TokenBucket(rate) for name, rate in DEFAULT_RPS.items()}
+        if rps:
+            self._rate_limiters[self.provider] = TokenBucket(rps)
+        # Translation memory; None when disabled. Only used from the main thread.
+        self.tm_ttl_days = tm_ttl_days
+        self._tm = self._open_tm(Path(tm_file)) if tm_file is not None else None
+        self._tm_pending = 0
+        # Results of this run's API calls by (source text, target language), so each
+        # distinct text is sent once per language however many keys share it
+        self._run_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # Keys present in each .strings file, and whether it has the machine-translation header
+        self._file_keys: Dict[str, Set[str]] = {}
+        self._file_has_header: Dict[str, bool] = {}
+        # Write-ahead log of .xcstrings translations not yet in the catalog file (opened on first write)
+        self._wal = None
+        # Languages that got new translations this run (or from the write-ahead log); only these are saved
+        self._dirty_languages: Set[str] = set()
         
         if not self.base_dir.exists():
             raise FileNotFoundError(f"Base directory not found: {base_dir}")
         
         self._initialize_translator()
         self._detect_format()
+        # The format is fixed from here on, so pick its translate/save methods once
+        if self.file_format == 'xcstrings':
+            self._translate_impl = self.translate_xcstrings
+            self._save_impl = self.save_xcstrings
+        else:
+            self._translate_impl = self.translate_strings
+            self._save_impl = lambda output_path=None: self.save_strings()
         self._load_catalog()
+        # The source language is fixed once the catalog is loaded
+        self._source_code = self._get_translation_code(self.source_language)
     
     def _initialize_translator(self):
         """Initialize the translation provider."""
@@ -143,22 +365,12 @@ class LocalizationTranslator:
             raise ImportError("deep-translator library is required. Install with: pip3 install deep-translator")
         
         try:
-            if self.provider == "google":
-                self.translator = GoogleTranslator()
-            elif self.provider == "deepl":
-                api_key = os.getenv("DEEPL_API_KEY")
-                if not api_key:
-                    raise ValueError("DEEPL_API_KEY environment variable not set")
-                self.translator = DeeplTranslator(api_key=api_key)
-            elif self.provider == "microsoft":
-                api_key = os.getenv("MICROSOFT_TRANSLATOR_API_KEY")
-                if not api_key:
-                    raise ValueError("MICROSOFT_TRANSLATOR_API_KEY environment variable not set")
-                self.translator = MicrosoftTranslator(api_key=api_key)
-            elif self.provider == "mymemory":
-                self.translator = MyMemoryTranslator()
-            else:
-                raise ValueError(f"Unknown provider: {self.provider}")
+            # Validates each configured provider; reversed so self.translator ends up as the primary's
+            for provider in reversed(self.providers):
+                key_env = PROVIDER_API_KEY_ENV.get(provider)
+                if key_env and not os.getenv(key_env):
+                    raise ValueError(f"{key_env} environment variable not set")
+                self.translator = self._create_translator(provider)
         except Exception as e:
             print(f"Error initializing translator: {e}")
             raise
@@ -171,6 +383,7 @@ class LocalizationTranslator:
         if xcstrings_file.exists():
             self.file_format = 'xcstrings'
             self.catalog_path = xcstrings_file
+            self.wal_path = xcstrings_file.with_suffix('.xcstrings.wal')
         elif strings_dir.exists():
             self.file_format = 'strings'
             self.catalog_path = None
@@ -189,12 +402,19 @@ class LocalizationTranslator:
     def _load_xcstrings(self):
         """Load .xcstrings file."""
         print(f"Loading catalog from: {self.catalog_path}")
-        with open(self.catalog_path, 'r', encoding='utf-8') as f:
-            self.catalog = json.load(f)
+        if ORJSON_AVAILABLE:
+            with open(self.catalog_path, 'rb') as f:
+                self.catalog = orjson.loads(f.read())
+        else:
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                self.catalog = json.load(f)
         
         self.source_language = self.catalog.get("sourceLanguage", "en")
         print(f"Source language: {self.source_language}")
         
+        # Translations from a run that stopped before its final save
+        self._replay_wal()
+        
         # Discover target languages from the catalog structure
         self._discover_target_languages()
         
@@ -203,6 +423,29 @@ class LocalizationTranslator:
         else:
             print(f"Target languages: {', '.join(sorted(self.target_languages))}")
     
+    def _replay_wal(self):
+        """Apply the translations recorded in the write-ahead log (see _wal_append) to the catalog."""
+        if not self.wal_path.exists():
+            return
+        strings = self.catalog.get("strings", {})
+        replayed = 0
+        with open(self.wal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Partially written last line
+                entry = strings.get(record["k"])
+                if entry is None:
+                    continue
+                entry.setdefault("localizations", {}).setdefault(record["l"], {})["stringUnit"] = {
+                    "state": record["s"],
+                    "value": record["v"]
+                }
+                self._dirty_languages.add(record["l"])
+                replayed += 1
+        print(f"Recovered {replayed} translations from {self.wal_path}")
+    
     def _load_strings(self):
         """Load .strings files."""
         self.catalog = {}
@@ -236,15 +479,10 @@ class LocalizationTranslator:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Match lines like: "key" = "value";
-        pattern = r'"([^"]+)"\s*=\s*"((?:[^"\\]|\\.)*)"\s*;'
-        matches = re.finditer(pattern, content, re.MULTILINE)
-        
-        for match in matches:
-            key = match.group(1)
-            value = match.group(2)
-            # Unescape the value
-            value = value.replace('\\"', '"').replace('\\n', '\n').replace('\\\\', '\\')
+        # Match lines like: "key" = "value"; only values containing a backslash need unescaping
+        for key, value in _STRINGS_RE.findall(content):
+            if '\\' in value:
+                value = _ESCAPE_RE.sub(lambda m: _UNESCAPES.get(m.group(1), m.group(0)), value)
             strings[key] = value
         
         return strings
@@ -259,47 +497,180 @@ class LocalizationTranslator:
         # Remove source language from target languages
         self.target_languages = languages - {self.source_language}
     
-    def _get_translation_code(self, lang_code: str) -> str:
+    def _open_tm(self, tm_file: Path) -> Optional[sqlite3.Connection]:
+        """Open the translation memory database, creating it if needed. Returns None if it can't be opened."""
+        try:
+            tm_file.parent.mkdir(parents=True, exist_ok=True)
+            tm = sqlite3.connect(tm_file)
+            tm.execute("CREATE TABLE IF NOT EXISTS tm (hash TEXT PRIMARY KEY, provider TEXT, src TEXT, "
+                       "tgt TEXT, source TEXT, target TEXT, ts REAL)")
+            return tm
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Translation memory disabled ({tm_file}: {e})")
+            return None
+
+    def _tm_hash(self, text: str, source_code: str, target_code: str, provider: Optional[str] = None) -> str:
+        return hashlib.blake2b(f"{provider or self.provider}|{source_code}|{target_code}|{text}".encode("utf-8"),
+                               digest_size=16).hexdigest()
+
+    def _tm_lookup(self, texts: List[str], source_code: str, target_code: str) -> List[Optional[str]]:
+        """Return the remembered translation for each text (None where there is none)."""
+        if self._tm is None:
+            return [None] * len(texts)
+        min_ts = time.time() - self.tm_ttl_days * 86400 if self.tm_ttl_days else 0
+        found = []
+        for text in texts:
+            row = None
+            if text and not self._is_untranslatable(text):
+                row = self._tm.execute("SELECT target FROM tm WHERE hash = ? AND ts >= ?",
+                                       (self._tm_hash(text, source_code, target_code), min_ts)).fetchone()
+            found.append(row[0] if row else None)
+        return found
+
+    def _tm_store(self, text: str, translated: str, source_code: str, target_code: str, provider: str):
+        """Remember an API translation under the provider that made it; rows are committed every
+        TM_COMMIT_EVERY inserts. Lookups use the primary provider, so a fallback provider's
+        translation is not served in place of the primary's on later runs.
+        """
+        if self._tm is None or self._is_untranslatable(text):
+            return
+        self._tm.execute("INSERT OR REPLACE INTO tm VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (self._tm_hash(text, source_code, target_code, provider), provider,
+                          source_code, target_code, text, translated, time.time()))
+        self._tm_pending += 1
+        if self._tm_pending >= TM_COMMIT_EVERY:
+            self._tm_flush()
+
+    def _tm_flush(self):
+        if self._tm is not None and self._tm_pending:
+            self._tm.commit()
+            self._tm_pending = 0
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_translation_code(lang_code: str) -> str:
         """Convert Xcode language code to translation API code."""
-        return self.LANGUAGE_CODE_MAP.get(lang_code, lang_code.split("-")[0] if "-" in lang_code else lang_code)
+        return LocalizationTranslator.LANGUAGE_CODE_MAP.get(lang_code, lang_code.split("-")[0] if "-" in lang_code else lang_code)
     
     @contextmanager
     def _progress_tracker(self, total: int, unit: str = "str"):
-        """Context manager yielding a tick() callable for progress. Uses tqdm when available, else print every 10."""
+        """Context manager yielding a tick(n=1) callable for progress. Uses tqdm when available, else print every 10.
+        Callers tick once per batch; the tqdm postfix is refreshed at most once a second.
+        """
         if PROGRESS_AVAILABLE and total > 0:
             pbar = tqdm(total=total, desc="Translating", unit=unit,
                         bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]')
-            def tick():
-                pbar.update(1)
+            last_postfix = [0.0]
+            def set_postfix():
                 pbar.set_postfix(translated=self.stats["translated"], skipped=self.stats["skipped"], errors=self.stats["errors"])
+            def tick(n=1):
+                pbar.update(n)
+                now = time.monotonic()
+                if now - last_postfix[0] > 1.0:
+                    last_postfix[0] = now
+                    set_postfix()
             try:
                 yield tick
             finally:
+                set_postfix()
                 pbar.close()
         else:
             if total > 0 and not PROGRESS_AVAILABLE:
                 print("Tip: Install 'tqdm' for progress bar: pip3 install tqdm\n")
             processed = [0]
-            def tick():
-                processed[0] += 1
-                if processed[0] % 10 == 0:
+            def tick(n=1):
+                processed[0] += n
+                if processed[0] // 10 > (processed[0] - n) // 10:
                     print(f"Progress: {processed[0]}/{total} ({processed[0] * 100 // total}%) - "
                           f"Translated: {self.stats['translated']}, Errors: {self.stats['errors']}")
             yield tick
     
-    def _do_single_translate(self, text: str, target_code: str, source_code: str):
+    def _create_translator(self, provider: str, source_code: Optional[str] = None, target_code: Optional[str] = None):
+        """Construct a deep_translator instance for one provider and language pair (the class's defaults if omitted)."""
+        translator_class = TRANSLATOR_CLASSES.get(provider)
+        if translator_class is None:
+            raise ValueError(f"Unknown provider: {provider}")
+        kwargs = {}
+        if provider in PROVIDER_API_KEY_ENV:
+            kwargs["api_key"] = os.getenv(PROVIDER_API_KEY_ENV[provider])
+        if source_code is not None:
+            kwargs["source"] = source_code
+        if target_code is not None:
+            kwargs["target"] = target_code
+        return translator_class(**kwargs)
+
+    def _get_translator(self, provider: str, source_code: str, target_code: str):
+        """Return this thread's translator for (provider, source, target), creating it on first use.
+        Instances keep per-request state, so each worker thread has its own.
+        """
+        translators = getattr(_thread_state, "translators", None)
+        if translators is None:
+            translators = _thread_state.translators = {}
+        key = (provider, source_code, target_code)
+        translator = translators.get(key)
+        if translator is None:
+            translator = translators[key] = self._create_translator(provider, source_code, target_code)
+        return translator
+
+    def _do_single_translate(self, text: str, target_code: str, source_code: str, provider: Optional[str] = None):
         """Perform one API call (run in thread for timeout)."""
-        if self.provider == "google":
-            return GoogleTranslator(source=source_code, target=target_code).translate(text)
-        if self.provider == "deepl":
-            return DeeplTranslator(api_key=os.getenv("DEEPL_API_KEY"),
-                                   source=source_code, target=target_code).translate(text)
-        if self.provider == "microsoft":
-            return MicrosoftTranslator(api_key=os.getenv("MICROSOFT_TRANSLATOR_API_KEY"),
-                                      source=source_code, target=target_code).translate(text)
-        if self.provider == "mymemory":
-            return MyMemoryTranslator(source=source_code, target=target_code).translate(text)
-        return None
+        return self._get_translator(provider or self.provider, source_code, target_code).translate(text)
+
+    def _translate_with_timeout(self, text: str, target_code: str, source_code: str, provider: Optional[str] = None):
+        """Perform one rate-limited API call, raising concurrent.futures.TimeoutError if it hangs.
+        Throttled requests and connection failures are retried with exponential backoff (full jitter).
+        On timeout a call still waiting in _request_pool's queue is cancelled; one already running
+        can't be abandoned and keeps its worker until the request returns.
+        """
+        provider = provider or self.provider
+        limiter = self._rate_limiters[provider]
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            limiter.acquire()
+            future = self._request_pool.submit(self._do_single_translate, text, target_code, source_code, provider)
+            try:
+                translated = future.result(timeout=TRANSLATE_REQUEST_TIMEOUT_SECONDS)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if _is_throttled(e):
+                    limiter.throttled()
+                if attempt + 1 == MAX_REQUEST_ATTEMPTS or not _is_retryable(e):
+                    raise
+            else:
+                limiter.succeeded()
+                return translated
+            time.sleep(random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)))
+
+    def _provider_order(self) -> List[str]:
+        """Providers to try, in configured order, with those cooling down after repeated failures moved last."""
+        now = time.monotonic()
+        with self._provider_lock:
+            cooling = {p for p in self._provider_chain if self._provider_cooldown_until[p] > now}
+        return [p for p in self._provider_chain if p not in cooling] + [p for p in self._provider_chain if p in cooling]
+
+    def _record_provider_result(self, provider: str, ok: bool):
+        """Track consecutive failures per provider; start a cooldown when they reach the threshold."""
+        with self._provider_lock:
+            if ok:
+                self._provider_failures[provider] = 0
+                return
+            self._provider_failures[provider] += 1
+            if self._provider_failures[provider] >= PROVIDER_FAILURE_THRESHOLD:
+                self._provider_failures[provider] = 0
+                self._provider_cooldown_until[provider] = time.monotonic() + PROVIDER_COOLDOWN_SECONDS
+                print(f"  {provider} keeps failing; trying other providers first for {PROVIDER_COOLDOWN_SECONDS}s")
+
+    def _translate_with_provider(self, text: str, target_code: str, source_code: str, provider: str):
+        """_translate_with_timeout, recording throttling, outages and timeouts against the provider's health."""
+        try:
+            translated = self._translate_with_timeout(text, target_code, source_code, provider)
+        except Exception as e:
+            if isinstance(e, concurrent.futures.TimeoutError) or _is_retryable(e):
+                self._record_provider_result(provider, False)
+            raise
+        self._record_provider_result(provider, True)
+        return translated
 
     def _is_untranslatable(self, text: str) -> bool:
         """True if the string should not be sent to the API (symbols, punctuation-only, etc.)."""
@@ -307,7 +678,7 @@ class LocalizationTranslator:
         if not s:
             return True
         # Format specifiers / placeholders
-        if s in ["", ":", "%@", "%d", "%f", "%.2f", "%.3f", "%.4f"]:
+        if s in _UNTRANSLATABLE_STRINGS:
             return True
         # Single character that isn't a letter (e.g. "*", ".", "-")
         if len(s) == 1 and not s.isalpha():
@@ -315,64 +686,197 @@ class LocalizationTranslator:
         # Very short punctuation/symbol sequence (e.g. "...", "**")
         if len(s) <= 3 and all(not c.isalnum() for c in s):
             return True
+        # No words once format specifiers and URLs are removed (e.g. "%1$@: %2$d", "https://...", "42", "→ 🙂")
+        if self.skip_filter:
+            remainder = _URL_RE.sub("", _FORMAT_SPECIFIER_RE.sub("", s))
+            if not any(c.isalpha() for c in remainder):
+                return True
         return False
 
-    def _translate_string(self, text: str, target_lang: str) -> Optional[str]:
-        """Translate a single string to target language. Tries primary provider, then MyMemory as fallback.
-        For untranslatable strings (e.g. '*', symbols), returns the source string so the catalog is filled with the same value.
+    def _translate_string(self, text: str, target_lang: str) -> Tuple[Optional[str], Optional[str]]:
+        """Translate a single string to target language, returning (translation, provider that made it).
+        Tries each provider in _provider_order() until one succeeds; (None, None) if all fail.
+        For untranslatable strings (e.g. '*', symbols), returns the source string (and no provider) so the
+        catalog is filled with the same value.
         """
         if not text or not text.strip():
-            return None
+            return None, None
 
         # Untranslatable: use source as "translation" so the slot is filled (e.g. "*" in all languages)
         if self._is_untranslatable(text):
-            return text
+            return text, None
 
         target_code = self._get_translation_code(target_lang)
-        source_code = self._get_translation_code(self.source_language)
-
-        def try_translate(provider: str) -> Optional[str]:
-            if provider == "google":
-                return GoogleTranslator(source=source_code, target=target_code).translate(text)
-            if provider == "deepl":
-                return DeeplTranslator(api_key=os.getenv("DEEPL_API_KEY"),
-                                       source=source_code, target=target_code).translate(text)
-            if provider == "microsoft":
-                return MicrosoftTranslator(api_key=os.getenv("MICROSOFT_TRANSLATOR_API_KEY"),
-                                          source=source_code, target=target_code).translate(text)
-            if provider == "mymemory":
-                return MyMemoryTranslator(source=source_code, target=target_code).translate(text)
-            return None
+        source_code = self._source_code
 
-        primary_error = None
-        try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(try_translate, self.provider)
-                translated = future.result(timeout=TRANSLATE_REQUEST_TIMEOUT_SECONDS)
-            if translated:
-                time.sleep(0.1)
-                return translated
-        except concurrent.futures.TimeoutError:
-            primary_error = f"Timeout ({TRANSLATE_REQUEST_TIMEOUT_SECONDS}s)"
-        except Exception as e:
-            primary_error = str(e)
-
-        # Fallback: try MyMemory when primary fails (e.g. "No translation was found" for short/format strings)
-        if self.provider != "mymemory":
+        # A provider that fails (or finds no translation, e.g. for short/format strings) hands over to the next
+        first_error = None
+        for provider in self._provider_order():
             try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(try_translate, "mymemory")
-                    translated = future.result(timeout=TRANSLATE_REQUEST_TIMEOUT_SECONDS)
+                translated = self._translate_with_provider(text, target_code, source_code, provider)
                 if translated:
-                    time.sleep(0.1)
-                    print(f"  Fallback (MyMemory) for '{text[:40]}...' -> {target_lang}")
-                    return translated
-            except Exception:
-                pass
+                    if provider != self.provider:
+                        print(f"  Fallback ({provider}) for '{text[:40]}...' -> {target_lang}")
+                    return translated, provider
+            except concurrent.futures.TimeoutError:
+                first_error = first_error or f"Timeout ({TRANSLATE_REQUEST_TIMEOUT_SECONDS}s)"
+            except Exception as e:
+                first_error = first_error or str(e)
 
-        print(f"  Error translating '{text[:50]}...' to {target_lang}: {primary_error}")
-        self.stats["errors"] += 1
-        return None
+        print(f"  Error translating '{text[:50]}...' to {target_lang}: {first_error}")
+        with self._stats_lock:
+            self.stats["errors"] += 1
+        return None, None
+
+    def _protect_format_specifiers(self, text: str) -> Tuple[str, List[str]]:
+        """Replace the format specifiers in text with __PH0__, __PH1__, ... and return them in order."""
+        if not text or self._is_untranslatable(text):
+            return text, []
+        specifiers: List[str] = []
+        def placeholder(match):
+            specifiers.append(match.group(0))
+            return f"__PH{len(specifiers) - 1}__"
+        return _FORMAT_SPECIFIER_RE.sub(placeholder, text), specifiers
+
+    def _restore_format_specifiers(self, translated: str, specifiers: List[str]) -> Optional[str]:
+        """Put the specifiers back into a translation; None if a placeholder was lost, duplicated or invented.
+        If the translation moved arguments around, unnumbered specifiers are numbered (%@ -> %1$@)
+        so each still takes its original argument.
+        """
+        order: List[int] = []
+        def note(match):
+            order.append(int(match.group(1)))
+            return match.group(0)
+        _PLACEHOLDER_RE.sub(note, translated)
+        if sorted(order) != list(range(len(specifiers))):
+            return None
+        if order != sorted(order):
+            numbered = []
+            position = 0
+            for specifier in specifiers:
+                if specifier != "%%":
+                    position += 1
+                    if not re.match(r"%\d+\$", specifier):
+                        specifier = f"%{position}${specifier[1:]}"
+                numbered.append(specifier)
+            specifiers = numbered
+        return _PLACEHOLDER_RE.sub(lambda match: specifiers[int(match.group(1))], translated)
+
+    def _translate_batch(self, texts: List[str], target_lang: str) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Translate several strings to target language, returning (translation, provider) in the same order.
+        Format specifiers are swapped for placeholders around the API call, since providers tend to
+        mangle them (%@ -> % @); a string whose placeholders don't survive is sent again as-is.
+        """
+        protected = [self._protect_format_specifiers(text) for text in texts]
+        results = self._translate_joined([sanitized for sanitized, _ in protected], target_lang)
+        for i, ((_, specifiers), (result, provider)) in enumerate(zip(protected, results)):
+            if result and specifiers:
+                restored = self._restore_format_specifiers(result, specifiers)
+                if restored is None:
+                    results[i] = self._translate_string(texts[i], target_lang)
+                else:
+                    results[i] = (restored, provider)
+        return results
+
+    def _translate_joined(self, texts: List[str], target_lang: str) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Translate several strings to target language, returning (translation, provider) in the same order.
+        Single-line strings are sent newline-joined, so one request covers many of them. A request
+        that comes back with a different number of lines is split in half and each half retried,
+        so one string the provider merges or splits doesn't cost a request per string. A request
+        that fails, a chunk of two or less that still mismatches, and multi-line and untranslatable
+        strings go string by string through _translate_string.
+        """
+        results: List[Tuple[Optional[str], Optional[str]]] = [(None, None)] * len(texts)
+        joinable = []
+        for i, text in enumerate(texts):
+            if self.batch_size > 1 and text and text.strip() and "\n" not in text and not self._is_untranslatable(text):
+                joinable.append(i)
+            else:
+                results[i] = self._translate_string(text, target_lang)
+
+        target_code = self._get_translation_code(target_lang)
+        source_code = self._source_code
+        # Joined requests go to the first provider not cooling down
+        provider = self._provider_order()[0]
+        max_chars = BATCH_MAX_CHARS.get(provider, DEFAULT_BATCH_MAX_CHARS)
+        # Stack of chunks still to send, next one last
+        pending = self._batch_chunks(joinable, texts, max_chars)[::-1]
+        while pending:
+            chunk = pending.pop()
+            lines = None
+            if len(chunk) > 1:
+                try:
+                    translated = self._translate_with_provider("\n".join(texts[i] for i in chunk), target_code, source_code, provider)
+                    if translated:
+                        lines = translated.split("\n")
+                except Exception:
+                    pass
+            if lines is not None and len(lines) == len(chunk) and all(line.strip() for line in lines):
+                for i, line in zip(chunk, lines):
+                    results[i] = (line, provider)
+            elif lines is not None and len(chunk) > 2:
+                half = len(chunk) // 2
+                pending.append(chunk[half:])
+                pending.append(chunk[:half])
+            else:
+                for i in chunk:
+                    results[i] = self._translate_string(texts[i], target_lang)
+        return results
+
+    def _translate_batches(self, batches: List[Tuple[str, List[str]]]):
+        """Translate (target_lang, texts) batches concurrently, yielding each batch's results in order.
+        Texts already in the translation memory are not sent, and a text repeated within the run is
+        sent only the first time; new translations are added to the memory.
+        """
+        source_code = self._source_code
+        remembered = []
+        to_send = []
+        queued = set()
+        for target_lang, texts in batches:
+            found = self._tm_lookup(texts, source_code, self._get_translation_code(target_lang))
+            remembered.append(found)
+            unique = []
+            for text, hit in zip(texts, found):
+                key = (text, target_lang)
+                if hit is None and key not in self._run_cache and key not in queued:
+                    queued.add(key)
+                    unique.append(text)
+            to_send.append((target_lang, unique))
+
+        sent = self._pool.map(lambda batch: self._translate_batch(batch[1], batch[0]), to_send)
+        for (target_lang, texts), found, (_, unique), translated in zip(batches, remembered, to_send, sent):
+            target_code = self._get_translation_code(target_lang)
+            for text, (result, provider) in zip(unique, translated):
+                self._run_cache[(text, target_lang)] = result
+                if result and provider:
+                    self._tm_store(text, result, source_code, target_code, provider)
+            # A repeated text was sent with this batch or an earlier one
+            results = []
+            for text, hit in zip(texts, found):
+                if hit is not None:
+                    self.stats["tm_hits"] += 1
+                    results.append(hit)
+                else:
+                    results.append(self._run_cache[(text, target_lang)])
+            yield results
+
+    def _batch_chunks(self, indexes: List[int], texts: List[str], max_chars: int) -> List[List[int]]:
+        """Pack indexes into as few chunks as possible of at most batch_size strings and max_chars
+        joined characters (first-fit decreasing: longest strings first, each into the first chunk with room).
+        """
+        chunks: List[List[int]] = []
+        sizes: List[int] = []
+        for i in sorted(indexes, key=lambda i: len(texts[i]), reverse=True):
+            length = len(texts[i]) + 1
+            for n, chunk in enumerate(chunks):
+                if len(chunk) < self.batch_size and sizes[n] + length <= max_chars:
+                    chunk.append(i)
+                    sizes[n] += length
+                    break
+            else:
+                chunks.append([i])
+                sizes.append(length)
+        return chunks
     
     def _extract_source_string(self, entry: Dict, key: Optional[str] = None) -> Optional[str]:
         """Extract the source string from a .xcstrings catalog entry.
@@ -400,42 +904,52 @@ class LocalizationTranslator:
             return
         
         strings = self.catalog.get("strings", {})
-        total = len([k for k, v in strings.items() if self._extract_source_string(v, k) is not None])
-        self.stats["total_strings"] = total
-        num_languages = len(self.target_languages)
-        total_translations = total * num_languages
+        languages = sorted(self.target_languages)
 
-        # Count how many translations already exist (skip needs_review if retry_needs_review) and incomplete strings
+        # One pass over the catalog: count strings and collect the (key, entry, source text)
+        # triples still to translate per target language. Existing translations are skipped
+        # (resume); with --retry-needs-review, needs_review ones are re-translated.
+        work: Dict[str, List[Tuple[str, Dict, str]]] = {lang: [] for lang in languages}
+        total = 0
         existing_count = 0
         incomplete_string_count = 0
         for key, entry in strings.items():
             source_text = self._extract_source_string(entry, key)
+            if source_text is None:
+                continue
+            total += 1
             if not source_text:
                 continue
+
+            # Initialize localizations if needed
+            if "localizations" not in entry:
+                entry["localizations"] = {}
+            localizations = entry["localizations"]
+
             string_complete = True
-            for target_lang in self.target_languages:
-                if target_lang in entry.get("localizations", {}):
-                    su = entry["localizations"][target_lang].get("stringUnit", {})
+            for target_lang in languages:
+                if target_lang in localizations:
+                    su = localizations[target_lang].get("stringUnit", {})
                     existing = su.get("value")
-                    if existing and existing.strip():
-                        if self.retry_needs_review and su.get("state") == "needs_review":
-                            string_complete = False
-                        else:
-                            existing_count += 1
-                    else:
-                        string_complete = False
-                else:
-                    string_complete = False
+                    if existing and existing.strip() and not (self.retry_needs_review and su.get("state") == "needs_review"):
+                        existing_count += 1
+                        continue
+                work[target_lang].append((key, entry, source_text))
+                string_complete = False
             if not string_complete:
                 incomplete_string_count += 1
 
+        self.stats["total_strings"] = total
+        self.stats["skipped"] += existing_count
+        num_languages = len(languages)
+        total_translations = total * num_languages
         translations_remaining = total_translations - existing_count
         # When there's work left, at least one string is incomplete (avoid "0 strings incomplete")
         if translations_remaining > 0 and incomplete_string_count == 0:
             incomplete_string_count = 1
 
         print(f"\nTranslating {total} strings to {num_languages} languages ({total_translations} total translations)")
-        print(f"Provider: {self.provider}")
+        print(f"Provider: {', '.join(self.providers)}")
         print(f"Auto-saving every {self.save_interval} translations")
         if existing_count > 0:
             print(f"Resuming: {incomplete_string_count} strings incomplete; {existing_count} translations already done, {translations_remaining} remaining")
@@ -444,55 +958,41 @@ class LocalizationTranslator:
         if self.dry_run:
             print("DRY RUN MODE - No changes will be saved\n")
 
-        with self._progress_tracker(translations_remaining, unit="trans") as tick:
-            for key, entry in strings.items():
-                source_text = self._extract_source_string(entry, key)
-                if not source_text:
-                    continue
+        batches = [
+            (target_lang, items[start:start + self.batch_size])
+            for target_lang, items in work.items()
+            for start in range(0, len(items), self.batch_size)
+        ]
 
-                # Initialize localizations if needed
-                if "localizations" not in entry:
-                    entry["localizations"] = {}
-
-                # Translate to each target language
-                for target_lang in sorted(self.target_languages):
-                    # Skip if translation already exists (resume). With --retry-needs-review, re-translate needs_review.
-                    if target_lang in entry["localizations"]:
-                        su = entry["localizations"][target_lang].get("stringUnit", {})
-                        existing = su.get("value")
-                        if existing and existing.strip():
-                            if self.retry_needs_review and su.get("state") == "needs_review":
-                                pass  # Re-translate
-                            else:
-                                self.stats["skipped"] += 1
-                                continue
-
-                    # Translate (this is the work we're tracking)
-                    translated = self._translate_string(source_text, target_lang)
-                    tick()
+        # Batches are translated concurrently; results are applied here, in order
+        with self._progress_tracker(translations_remaining, unit="trans") as tick:
+            all_results = self._translate_batches(
+                [(target_lang, [source_text for _, _, source_text in batch]) for target_lang, batch in batches]
+            )
+            for (target_lang, batch), results in zip(batches, all_results):
+                for (key, entry, source_text), translated in zip(batch, results):
                     # Use source as fallback when translation fails so the slot is filled (no missing translation)
                     if not translated:
                         translated = source_text
                         translation_state = "needs_review"
                     else:
-                        translation_state = "translated" if self.mark_as_translated else "needs_review"
-                    if translated:
-                        # Create localization entry
-                        if target_lang not in entry["localizations"]:
-                            entry["localizations"][target_lang] = {}
-
-                        entry["localizations"][target_lang]["stringUnit"] = {
-                            "state": translation_state,
-                            "value": translated
-                        }
-                        self.stats["translated"] += 1
+                        translation_state = self._translated_state
 
-                        # Periodic save
-                        if not self.dry_run and (self.stats["translated"] - self.last_save_count) >= self.save_interval:
-                            self._save_xcstrings_periodic()
-                            self.last_save_count = self.stats["translated"]
-                    else:
-                        self.stats["skipped"] += 1
+                    # Create localization entry
+                    entry["localizations"].setdefault(target_lang, {})["stringUnit"] = {
+                        "state": translation_state,
+                        "value": translated
+                    }
+                    self.stats["translated"] += 1
+                    self._dirty_languages.add(target_lang)
+                    if not self.dry_run:
+                        self._wal_append(key, target_lang, translated, translation_state)
+
+                    # Periodic save
+                    if not self.dry_run and (self.stats["translated"] - self.last_save_count) >= self.save_interval:
+                        self._save_xcstrings_periodic()
+                        self.last_save_count = self.stats["translated"]
+                tick(len(batch))
 
         # Final save: ensure any remaining translations are saved (e.g. when < save_interval done)
         if not self.dry_run and self.stats["translated"] > self.last_save_count:
@@ -514,13 +1014,15 @@ class LocalizationTranslator:
         self.stats["total_strings"] = len(en_keys)
         
         # Pre-calculate work items for better progress tracking
+        # Each language file is parsed once here; the translation loop reuses the result
         work_items = []
+        existing_per_lang: Dict[str, Dict[str, str]] = {}
         total_missing = 0
         for lang_code in sorted(languages_to_process):
             lang_file = self.base_dir / f'{lang_code}.lproj' / 'Localizable.strings'
             if lang_file.exists():
-                existing_strings = self._parse_strings_file(lang_file)
-                missing = en_keys - set(existing_strings.keys())
+                existing_strings = existing_per_lang[lang_code] = self._parse_strings_file(lang_file)
+                missing = en_keys.difference(existing_strings)
                 for key in missing:
                     work_items.append((lang_code, key))
                 total_missing += len(missing)
@@ -532,7 +1034,7 @@ class LocalizationTranslator:
         print(f"Total keys: {len(en_keys)}")
         print(f"Target languages: {len(languages_to_process)} ({', '.join(sorted(languages_to_process))})")
         print(f"Translations needed: {total_missing}")
-        print(f"Provider: {self.provider}")
+        print(f"Provider: {', '.join(self.providers)}")
         print(f"Auto-saving every {self.save_interval} translations")
         if self.dry_run:
             print(f"Mode: DRY RUN (no changes will be saved)")
@@ -550,7 +1052,9 @@ class LocalizationTranslator:
             print("DRY RUN MODE - No changes will be saved\n")
         
         with self._progress_tracker(total_missing, unit="trans") as tick:
-            for lang_code, key in work_items:
+            # Sort out what still needs translating, then translate it in batches
+            batches = []
+            for lang_code, lang_items in itertools.groupby(work_items, key=lambda item: item[0]):
                 if lang_code not in self.LANGUAGE_NAMES:
                     continue
                 
@@ -559,37 +1063,47 @@ class LocalizationTranslator:
                     self.catalog[lang_code] = {}
                 lang_strings = self.catalog[lang_code]
                 
-                # Load existing translations from file (resume capability)
-                lang_file = self.base_dir / f'{lang_code}.lproj' / 'Localizable.strings'
-                if lang_file.exists():
-                    existing_strings = self._parse_strings_file(lang_file)
-                    lang_strings.update(existing_strings)
-                
-                # Skip if already translated
-                if key in lang_strings:
-                    self.stats["skipped"] += 1
-                    tick()
-                    continue
-                
-                english_value = en_strings.get(key, '')
-                if not english_value:
-                    self.stats["skipped"] += 1
-                    tick()
-                    continue
+                # Existing translations from file (resume capability)
+                lang_strings.update(existing_per_lang[lang_code])
                 
-                # Translate
-                translated = self._translate_string(english_value, lang_code)
-                if translated:
-                    lang_strings[key] = translated
-                    self.stats["translated"] += 1
+                pending = []
+                skipped = 0
+                for _, key in lang_items:
+                    # Skip if already translated
+                    if key in lang_strings:
+                        skipped += 1
+                        continue
                     
-                    # Periodic save
-                    if not self.dry_run and (self.stats["translated"] - self.last_save_count) >= self.save_interval:
-                        self._save_strings_periodic(lang_code, lang_strings)
-                        self.last_save_count = self.stats["translated"]
-                else:
-                    self.stats["skipped"] += 1
-                tick()
+                    english_value = en_strings.get(key, '')
+                    if not english_value:
+                        skipped += 1
+                        continue
+                    pending.append((key, english_value))
+                self.stats["skipped"] += skipped
+                tick(skipped)
+                
+                for start in range(0, len(pending), self.batch_size):
+                    batches.append((lang_code, pending[start:start + self.batch_size]))
+            
+            # Batches are translated concurrently; results are applied here, in order
+            all_results = self._translate_batches(
+                [(lang_code, [english_value for _, english_value in batch]) for lang_code, batch in batches]
+            )
+            for (lang_code, batch), results in zip(batches, all_results):
+                lang_strings = self.catalog[lang_code]
+                for (key, _), translated in zip(batch, results):
+                    if translated:
+                        lang_strings[key] = translated
+                        self.stats["translated"] += 1
+                        self._dirty_languages.add(lang_code)
+                        
+                        # Periodic save
+                        if not self.dry_run and (self.stats["translated"] - self.last_save_count) >= self.save_interval:
+                            self._save_strings_periodic(lang_code, lang_strings)
+                            self.last_save_count = self.stats["translated"]
+                    else:
+                        self.stats["skipped"] += 1
+                tick(len(batch))
 
         # Final save: ensure any remaining translations are saved (e.g. when < save_interval done)
         if not self.dry_run and self.stats["translated"] > self.last_save_count:
@@ -599,10 +1113,8 @@ class LocalizationTranslator:
     
     def translate(self, target_languages: Optional[List[str]] = None):
         """Translate based on file format."""
-        if self.file_format == 'xcstrings':
-            self.translate_xcstrings(target_languages)
-        else:
-            self.translate_strings(target_languages)
+        self._translate_impl(target_languages)
+        self._tm_flush()
         
         print(f"\n{'='*60}")
         print(f"Translation Complete!")
@@ -610,6 +1122,8 @@ class LocalizationTranslator:
         print(f"  Total strings: {self.stats['total_strings']}")
         print(f"  Translations created: {self.stats['translated']}")
         print(f"  Already translated (skipped): {self.stats['skipped']}")
+        if self.stats["tm_hits"]:
+            print(f"  Reused from translation memory: {self.stats['tm_hits']}")
         print(f"  Errors: {self.stats['errors']}")
         print(f"{'='*60}")
     
@@ -617,25 +1131,27 @@ class LocalizationTranslator:
         """Escape a string for use in .strings file."""
         return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
     
+    def _wal_append(self, key: str, lang: str, value: str, state: str):
+        """Record one translation in the write-ahead log; made durable by _save_xcstrings_periodic."""
+        try:
+            if self._wal is None:
+                self._wal = open(self.wal_path, 'a', encoding='utf-8')
+            self._wal.write(json.dumps({"k": key, "l": lang, "v": value, "s": state}, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"  ⚠️  Warning: Failed to log translation: {e}", flush=True)
+    
     def _save_xcstrings_periodic(self):
-        """Periodically save .xcstrings file during translation. Uses atomic write + flush/fsync so progress persists on interrupt."""
-        output = Path(self.catalog_path)
+        """Periodically save .xcstrings progress during translation.
+        Translations are appended to the write-ahead log as they are made, so this only flushes and
+        fsyncs the log; the catalog itself is rewritten once, by save_xcstrings.
+        """
+        if self._wal is None:
+            return
         try:
-            fd, tmp = tempfile.mkstemp(dir=output.parent, prefix=".xcstrings.", suffix=".tmp")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(self.catalog, f, ensure_ascii=False, indent=2)
-                    f.flush()
-                    os.fsync(f.fileno())
-                os.replace(tmp, output)
-                print(f"  💾 Auto-saved progress ({self.stats['translated']} translations so far)", flush=True)
-            except Exception:
-                try:
-                    os.unlink(tmp)
-                except OSError:
-                    pass
-                raise
-        except Exception as e:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+            print(f"  💾 Auto-saved progress ({self.stats['translated']} translations so far)", flush=True)
+        except OSError as e:
             print(f"  ⚠️  Warning: Failed to auto-save: {e}", flush=True)
     
     def save_xcstrings(self, output_path: Optional[Path] = None):
@@ -645,6 +1161,9 @@ class LocalizationTranslator:
             return
         
         output = Path(output_path) if output_path else self.catalog_path
+        if output == self.catalog_path and not self._dirty_languages and not self.wal_path.exists():
+            print("\nNo new translations; catalog left unchanged")
+            return
         
         # Only create backup on final save (not during periodic saves) and if flag is set
         if not hasattr(self, '_backup_created'):
@@ -652,19 +1171,86 @@ class LocalizationTranslator:
             if self.create_backup:
                 backup_path = output.with_suffix('.xcstrings.backup')
                 if output.exists():
-                    shutil.copy2(output, backup_path)
+                    # The catalog is replaced with a new file below rather than rewritten, so a
+                    # hardlink keeps the old contents without copying them
+                    if backup_path.exists():
+                        os.remove(backup_path)
+                    try:
+                        os.link(output, backup_path)
+                    except OSError:
+                        shutil.copy2(output, backup_path)
                     print(f"Backup created: {backup_path}")
             self._backup_created = True
         else:
             print(f"\nFinal save to: {output}")
         
-        # Save with proper formatting (flush+fsync so it persists)
-        with open(output, 'w', encoding='utf-8') as f:
-            json.dump(self.catalog, f, ensure_ascii=False, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
+        # Save with proper formatting. Written to a temp file (flush+fsync) and renamed over the
+        # catalog, so an interrupted save never leaves a truncated catalog behind. orjson, when
+        # installed, produces the same bytes as json.dumps(ensure_ascii=False, indent=2), faster.
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.catalog, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.catalog, ensure_ascii=False, indent=2).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=output.parent, prefix=".xcstrings.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file 0600; keep the catalog's own permissions
+            if output.exists():
+                shutil.copymode(output, tmp)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp, 0o666 & ~umask)
+            os.replace(tmp, output)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        
+        # The catalog now holds everything the write-ahead log recorded
+        if output == self.catalog_path:
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+            if self.wal_path.exists():
+                os.remove(self.wal_path)
         print("Catalog saved successfully!")
     
+    def _append_new_strings(self, lang_code: str, lang_file: Path, strings: Dict[str, str]) -> bool:
+        """Append the entries of strings whose keys aren't in lang_file yet. Returns True if any were written.
+        The file's keys are read once per run and then kept up to date as entries are appended.
+        """
+        if lang_code not in self._file_keys:
+            with open(lang_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self._file_keys[lang_code] = {match.group(1) for match in _STRINGS_RE.finditer(content)}
+            self._file_has_header[lang_code] = 'MACHINE TRANSLATIONS - REVIEW REQUIRED' in content
+        file_keys = self._file_keys[lang_code]
+        
+        new_keys = [key for key in sorted(strings.keys()) if key not in file_keys]
+        if not new_keys:
+            return False
+        new_translations = [
+            f'"{self._escape_string(key)}" = "{self._escape_string(strings[key])}";\n' for key in new_keys
+        ]
+        
+        with open(lang_file, 'a', encoding='utf-8') as f:
+            # Add the header comment before the first machine translation
+            if not self._file_has_header[lang_code]:
+                f.write('\n')
+                f.write('/* ============================================================================\n')
+                f.write('   MACHINE TRANSLATIONS - REVIEW REQUIRED\n')
+                f.write('   ============================================================================ */\n')
+            f.write(''.join(new_translations))
+        self._file_has_header[lang_code] = True
+        file_keys.update(new_keys)
+        return True
+    
     def _save_strings_periodic(self, lang_code: str, lang_strings: Dict[str, str]):
         """Periodically save .strings file during translation."""
         lang_file = self.base_dir / f'{lang_code}.lproj' / 'Localizable.strings'
@@ -673,33 +1259,7 @@ class LocalizationTranslator:
             return
         
         try:
-            # Read existing content
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find new translations that aren't in file yet
-            new_translations = []
-            for key in sorted(lang_strings.keys()):
-                if key not in content:
-                    value = lang_strings[key]
-                    escaped_key = self._escape_string(key)
-                    escaped_value = self._escape_string(value)
-                    new_translations.append(f'"{escaped_key}" = "{escaped_value}";\n')
-            
-            if new_translations:
-                # Check if we need to add the header comment
-                if 'MACHINE TRANSLATIONS - REVIEW REQUIRED' not in content:
-                    with open(lang_file, 'a', encoding='utf-8') as f:
-                        f.write('\n')
-                        f.write('/* ============================================================================\n')
-                        f.write('   MACHINE TRANSLATIONS - REVIEW REQUIRED\n')
-                        f.write('   ============================================================================ */\n')
-                        f.write(''.join(new_translations))
-                else:
-                    # Just append new translations
-                    with open(lang_file, 'a', encoding='utf-8') as f:
-                        f.write(''.join(new_translations))
-                
+            if self._append_new_strings(lang_code, lang_file, lang_strings):
                 print(f"  💾 Auto-saved {lang_code} ({self.stats['translated']} translations so far)")
         except Exception as e:
             print(f"  ⚠️  Warning: Failed to auto-save {lang_code}: {e}")
@@ -711,8 +1271,8 @@ class LocalizationTranslator:
             return
         
         for lang_code, strings in self.catalog.items():
-            if lang_code == 'en':
-                continue  # Don't overwrite English file
+            if lang_code == 'en' or lang_code not in self._dirty_languages:
+                continue  # Don't overwrite English file; other files only get new translations appended
             
             lang_file = self.base_dir / f'{lang_code}.lproj' / 'Localizable.strings'
             
@@ -728,48 +1288,31 @@ class LocalizationTranslator:
                 if self.create_backup:
                     backup_path = lang_file.with_suffix('.strings.backup')
                     if lang_file.exists():
+                        # A real copy: new strings are appended to lang_file in place
                         shutil.copy2(lang_file, backup_path)
                         print(f"Backup created: {backup_path}")
                 self._backups_created.add(lang_code)
             
-            # Read existing content to preserve structure
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Append new translations that aren't already in file
-            new_translations = []
-            for key in sorted(strings.keys()):
-                if key not in content:  # Only add if not already present
-                    value = strings[key]
-                    escaped_key = self._escape_string(key)
-                    escaped_value = self._escape_string(value)
-                    new_translations.append(f'"{escaped_key}" = "{escaped_value}";\n')
-            
-            if new_translations:
-                # Check if header comment exists
-                if 'MACHINE TRANSLATIONS - REVIEW REQUIRED' not in content:
-                    with open(lang_file, 'a', encoding='utf-8') as f:
-                        f.write('\n')
-                        f.write('/* ============================================================================\n')
-                        f.write('   MACHINE TRANSLATIONS - REVIEW REQUIRED\n')
-                        f.write('   ============================================================================ */\n')
-                        f.write(''.join(new_translations))
-                else:
-                    # Just append new translations
-                    with open(lang_file, 'a', encoding='utf-8') as f:
-                        f.write(''.join(new_translations))
-                
+            # Append new translations that aren't already in file (preserves its structure)
+            if self._append_new_strings(lang_code, lang_file, strings):
                 print(f"✓ Updated {lang_file}")
     
     def save(self, output_path: Optional[Path] = None):
         """Save the translated files."""
-        if self.file_format == 'xcstrings':
-            self.save_xcstrings(output_path)
-        else:
-            self.save_strings()
+        self._save_impl(output_path)
 
 
-def main():
+def _provider_list(value: str) -> str:
+    """argparse type for --provider: one provider name or a comma-separated list of them."""
+    names = [p.strip() for p in value.split(",") if p.strip()]
+    unknown = [p for p in names if p not in PROVIDERS]
+    if not names or unknown:
+        raise argparse.ArgumentTypeError(
+            f"invalid provider: {', '.join(unknown) or value!r} (choose from {', '.join(PROVIDERS)})")
+    return ",".join(names)
+
+
+def main() -> int:
     parser = argparse.ArgumentParser(
         description="Auto-translate localization files (.strings or .xcstrings) using machine translation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -784,6 +1327,9 @@ Examples:
   # Use DeepL (requires API key)
   DEEPL_API_KEY=your_key python3 generate_missing_translations.py --base-dir Resources --provider deepl
 
+  # Use DeepL, falling back to Google when DeepL fails or rate limits
+  DEEPL_API_KEY=your_key python3 generate_missing_translations.py --base-dir Resources --provider deepl,google
+
   # Dry run to see what would be translated
   python3 generate_missing_translations.py --base-dir Resources --dry-run
 
@@ -807,10 +1353,10 @@ Examples:
     
     parser.add_argument(
         "--provider",
-        type=str,
-        choices=["google", "deepl", "microsoft", "mymemory"],
+        type=_provider_list,
         default="google",
-        help="Translation provider (default: google)"
+        help=f"Translation provider, or a comma-separated fallback order such as deepl,google "
+             f"({', '.join(PROVIDERS)}; default: google)"
     )
     
     parser.add_argument(
@@ -845,6 +1391,47 @@ Examples:
         help="Create backups of localization files before saving (default: False)"
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Strings sent per translation request (default: {DEFAULT_BATCH_SIZE}). Use 1 to translate each string separately."
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Translation requests in flight at once (default: {DEFAULT_CONCURRENCY}). Lower it if the provider starts rate limiting."
+    )
+
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=None,
+        help="Maximum requests per second to the provider (default: google 20, deepl 10, microsoft 10, mymemory 1). "
+             "The rate is lowered while the provider throttles and recovers gradually."
+    )
+
+    parser.add_argument(
+        "--no-skip-filter",
+        action="store_true",
+        help="Send every string to the provider, even ones with no words (only format specifiers, URLs, numbers or symbols)"
+    )
+
+    parser.add_argument(
+        "--no-tm",
+        action="store_true",
+        help=f"Don't read or update the translation memory ({DEFAULT_TM_FILE})"
+    )
+
+    parser.add_argument(
+        "--tm-ttl-days",
+        type=float,
+        default=None,
+        help="Ignore translation memory entries older than this many days (default: keep forever)"
+    )
+
     parser.add_argument(
         "--retry-needs-review",
         action="store_true",
@@ -868,7 +1455,13 @@ Examples:
             save_interval=args.save_interval,
             mark_as_translated=args.mark_as_translated,
             create_backup=args.backup,
-            retry_needs_review=args.retry_needs_review
+            retry_needs_review=args.retry_needs_review,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            tm_file=None if args.no_tm else DEFAULT_TM_FILE,
+            tm_ttl_days=args.tm_ttl_days,
+            skip_filter=not args.no_skip_filter,
+            rps=args.rps
         )
         
         translator.translate(target_languages=args.languages)
@@ -877,12 +1470,13 @@ Examples:
         print("\n✅ Translation complete!")
         if args.dry_run:
             print("Run without --dry-run to apply translations.")
+        return 0
         
     except Exception as e:
         print(f"\n❌ Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 